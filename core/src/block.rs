@@ -239,7 +239,7 @@ impl Block {
 
         // Build merkle tree
         while hashes.len() > 1 {
-            let mut next_level = Vec::new();
+            let mut next_level = Vec::with_capacity(hashes.len().div_ceil(2));
 
             for i in (0..hashes.len()).step_by(2) {
                 let left = &hashes[i];
@@ -249,8 +249,12 @@ impl Block {
                     left // Duplicate if odd number
                 };
 
-                let combined = format!("{}{}", left, right);
-                let hash = Sha3_256::digest(combined.as_bytes());
+                // Feed both halves straight into the hasher instead of
+                // concatenating them into a temporary String first.
+                let hash = Sha3_256::new()
+                    .chain_update(left.as_bytes())
+                    .chain_update(right.as_bytes())
+                    .finalize();
                 next_level.push(hex::encode(hash));
             }
 
@@ -908,6 +912,30 @@ mod tests {
         assert_eq!(gold_reward / free_reward, 1000); // 1000x weight
     }
 
+    #[test]
+    fn test_merkle_root_matches_concatenated_pair_hash() {
+        let outputs = vec![TxOutput::new(
+            10_000_000_000,
+            "validator_address".to_string(),
+        )];
+        let counts = MasternodeCounts::default();
+        let mut block = Block::new(
+            1,
+            "previous_hash".to_string(),
+            "validator".to_string(),
+            outputs,
+            &counts,
+        );
+        let mut second = block.transactions[0].clone();
+        second.txid = "second_txid".to_string();
+        block.transactions.push(second);
+
+        let left = &block.transactions[0].txid;
+        let right = &block.transactions[1].txid;
+        let expected = hex::encode(Sha3_256::digest(format!("{}{}", left, right).as_bytes()));
+        assert_eq!(block.calculate_merkle_root(), expected);
+    }
+
     #[test]
     fn test_block_creation() {
         let outputs = vec![TxOutput::new(
@@ -177,9 +177,15 @@ impl HttpDiscovery {
     }
 }
 
+/// Mainnet DNS seed hostnames.
+const MAINNET_DNS_SEEDS: &[&str] = &["dnsseed.time-coin.io", "seed.time-coin.io"];
+
+/// Testnet DNS seed hostnames (DNS seeder not yet deployed).
+const TESTNET_DNS_SEEDS: &[&str] = &[];
+
 /// DNS-based peer discovery
 pub struct DnsDiscovery {
-    dns_seeds: Vec<String>,
+    dns_seeds: &'static [&'static str],
     network: NetworkType,
 }
 
@@ -187,36 +193,34 @@ impl DnsDiscovery {
     /// Create new DNS discovery
     pub fn new(network: NetworkType) -> Self {
         let dns_seeds = match network {
-            NetworkType::Mainnet => vec![
-                "dnsseed.time-coin.io".to_string(),
-                "seed.time-coin.io".to_string(),
-            ],
-            NetworkType::Testnet => vec![], // DNS seeder not yet deployed
+            NetworkType::Mainnet => MAINNET_DNS_SEEDS,
+            NetworkType::Testnet => TESTNET_DNS_SEEDS,
         };
 
         DnsDiscovery { dns_seeds, network }
     }
 
-    /// Resolve DNS seeds to get peer addresses
+    /// Resolve DNS seeds to get peer addresses.
+    ///
+    /// All seeds are looked up concurrently, so one slow or dead seed does not
+    /// delay the others.
     pub async fn resolve_peers(&self) -> Result<Vec<SocketAddr>, String> {
-        let mut peers = Vec::new();
-
         // Use the correct port based on network type
         let port = match self.network {
             NetworkType::Mainnet => 24000,
             NetworkType::Testnet => 24100,
         };
 
-        for seed in &self.dns_seeds {
-            // Use network-appropriate port instead of hardcoded 9876
-            let lookup_addr = format!("{}:{}", seed, port);
+        let lookups = self
+            .dns_seeds
+            .iter()
+            .map(|seed| tokio::net::lookup_host((*seed, port)));
+        let results = futures::future::join_all(lookups).await;
 
-            match tokio::net::lookup_host(lookup_addr).await {
-                Ok(addrs) => {
-                    for addr in addrs {
-                        peers.push(addr);
-                    }
-                }
+        let mut peers = Vec::new();
+        for (seed, result) in self.dns_seeds.iter().zip(results) {
+            match result {
+                Ok(addrs) => peers.extend(addrs),
                 Err(e) => {
                     eprintln!("DNS lookup failed for {}: {}", seed, e);
                 }
@@ -262,9 +266,15 @@ impl PeerDiscovery {
             println!("  ✓ Found {} seed nodes from environment", all_peers.len());
         }
 
-        // 2. Try HTTP discovery from time-coin.io
-        println!("📡 Fetching peers from time-coin.io...");
-        match self.http_discovery.fetch_peers().await {
+        // 2 + 3. HTTP discovery from time-coin.io and DNS seed resolution are
+        // independent network round-trips, so run them concurrently.
+        println!("📡 Fetching peers from time-coin.io and resolving DNS seeds...");
+        let (http_result, dns_result) = tokio::join!(
+            self.http_discovery.fetch_peers(),
+            self.dns_discovery.resolve_peers()
+        );
+
+        match http_result {
             Ok(peers) => {
                 let http_count = peers.len();
                 println!("  ✓ Found {} peers via HTTP", http_count);
@@ -275,9 +285,7 @@ impl PeerDiscovery {
             }
         }
 
-        // 3. Try DNS discovery
-        println!("📡 Resolving DNS seeds...");
-        match self.dns_discovery.resolve_peers().await {
+        match dns_result {
             Ok(addrs) => {
                 println!("  ✓ Found {} peers via DNS", addrs.len());
                 for addr in addrs {
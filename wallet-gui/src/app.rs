@@ -271,7 +271,7 @@ impl eframe::App for App {
                         )
                     };
                     ui.label(
-                        egui::RichText::new(format!("v{}", env!("CARGO_PKG_VERSION")))
+                        egui::RichText::new(concat!("v", env!("CARGO_PKG_VERSION")))
                             .size(13.0)
                             .weak(),
                     );
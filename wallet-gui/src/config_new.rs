@@ -31,7 +31,7 @@
 
 use serde::{Deserialize, Serialize};
 use std::fs;
-use std::path::PathBuf;
+use std::path::{Path, PathBuf};
 
 // ============================================================================
 // Startup preferences  (~/.time-wallet/time.toml)
@@ -82,7 +82,7 @@ impl StartupPrefs {
              network = \"{}\"\n",
             self.network
         );
-        fs::write(&path, contents)?;
+        write_if_changed(&path, &contents)?;
         Ok(())
     }
 }
@@ -189,19 +189,19 @@ impl Config {
         // --- Step 1: determine network from time.toml (or migrate old layout) ---
         let prefs_path = StartupPrefs::path()?;
         let old_root_conf = data_dir.join("time.conf");
+        // Checked once: both migrations return early after writing time.toml,
+        // so the answer still holds for the first-run decision below.
+        let has_prefs = prefs_path.exists();
 
         // Migration A: old single time.conf that contains testnet=
-        if !prefs_path.exists() && old_root_conf.exists() {
+        if !has_prefs && old_root_conf.exists() {
             let contents = fs::read_to_string(&old_root_conf)?;
-            // Only migrate if it still contains the old testnet= key
-            if contents
-                .lines()
-                .any(|l| l.trim_start().starts_with("testnet="))
-            {
+            // Only migrate if it still contains the old testnet= key. Detection
+            // and parsing share one pass over the file.
+            if let Some(old_config) = Self::parse_time_conf_legacy(&contents) {
                 log::info!(
                     "🔄 Migrating time.conf (testnet= key) → time.toml + network-specific confs"
                 );
-                let old_config = Self::parse_time_conf_legacy(&contents);
                 let is_testnet = old_config.network == "testnet";
 
                 // Write time.toml
@@ -215,7 +215,7 @@ impl Config {
                 if let Some(parent) = net_conf_path.parent() {
                     fs::create_dir_all(parent)?;
                 }
-                fs::write(&net_conf_path, old_config.to_time_conf())?;
+                write_if_changed(&net_conf_path, &old_config.to_time_conf())?;
 
                 // Back up old root conf
                 let backup = old_root_conf.with_extension("conf.bak");
@@ -232,7 +232,7 @@ impl Config {
         }
 
         // Migration B: legacy config.toml
-        if !prefs_path.exists() {
+        if !has_prefs {
             let toml_path = data_dir.join("config.toml");
             if toml_path.exists() {
                 log::info!("🔄 Migrating config.toml → time.toml + network-specific time.conf");
@@ -264,7 +264,7 @@ impl Config {
             c.network = prefs.network;
             c.data_dir = Some(data_dir);
             c
-        } else if !prefs_path.exists() {
+        } else if !has_prefs {
             // Neither time.toml nor any time.conf — genuine first run
             log::info!("📝 First run — no config file found, network selection required");
             Config {
@@ -312,8 +312,9 @@ impl Config {
         if let Some(parent) = conf_path.parent() {
             fs::create_dir_all(parent)?;
         }
-        fs::write(&conf_path, self.to_time_conf())?;
-        log::info!("💾 Config saved to: {}", conf_path.display());
+        if write_if_changed(&conf_path, &self.to_time_conf())? {
+            log::info!("💾 Config saved to: {}", conf_path.display());
+        }
         Ok(())
     }
 
@@ -372,68 +373,62 @@ impl Config {
 
     /// Parse a legacy `time.conf` that may contain `testnet=`.
     /// Used only during migration.
-    fn parse_time_conf_legacy(contents: &str) -> Self {
+    ///
+    /// Returns `None` when the file has no `testnet=` key, i.e. it is already
+    /// in the current format and needs no migration.
+    fn parse_time_conf_legacy(contents: &str) -> Option<Self> {
         let mut config = Config::default();
+        let mut has_testnet_key = false;
 
-        for raw in contents.lines() {
-            let line = raw.find('#').map_or(raw, |p| &raw[..p]).trim();
-            if line.is_empty() {
-                continue;
-            }
-            let Some((key, value)) = line.split_once('=') else {
-                continue;
-            };
-            let key = key.trim();
-            let value = value.trim();
+        // Single pass: the legacy `testnet=` key is handled inline alongside
+        // the regular keys instead of re-scanning the file afterwards.
+        for (key, value) in conf_entries(contents) {
             if key == "testnet" {
+                has_testnet_key = true;
                 config.network = if value == "1" {
                     "testnet".to_string()
                 } else {
                     "mainnet".to_string()
                 };
+            } else {
+                Self::apply_conf_key(&mut config, key, value);
             }
         }
 
-        Self::apply_conf_keys(contents, &mut config);
-        config
+        has_testnet_key.then_some(config)
     }
 
     /// Apply non-network `time.conf` keys onto an existing `Config`.
     fn apply_conf_keys(contents: &str, config: &mut Config) {
-        for raw in contents.lines() {
-            let line = raw.find('#').map_or(raw, |p| &raw[..p]).trim();
-            if line.is_empty() {
-                continue;
+        for (key, value) in conf_entries(contents) {
+            Self::apply_conf_key(config, key, value);
+        }
+    }
+
+    /// Apply a single `time.conf` key onto an existing `Config`.
+    fn apply_conf_key(config: &mut Config, key: &str, value: &str) {
+        match key {
+            "addnode" if !value.is_empty() => {
+                config.peers.push(value.to_string());
             }
-            let Some((key, value)) = line.split_once('=') else {
-                continue;
-            };
-            let key = key.trim();
-            let value = value.trim();
-
-            match key {
-                "addnode" if !value.is_empty() => {
-                    config.peers.push(value.to_string());
-                }
-                "rpcuser" if !value.is_empty() => {
-                    config.rpc_user = Some(value.to_string());
-                }
-                "rpcpassword" if !value.is_empty() => {
-                    config.rpc_password = Some(value.to_string());
-                }
-                "maxconnections" => {
-                    if let Ok(n) = value.parse::<usize>() {
-                        config.max_connections = if n == 0 { usize::MAX } else { n };
-                    }
-                }
-                "wsendpoint" if !value.is_empty() => {
-                    config.ws_endpoint = Some(value.to_string());
-                }
-                "editor" if !value.is_empty() => {
-                    config.editor = Some(value.to_string());
+            "rpcuser" if !value.is_empty() => {
+                config.rpc_user = Some(value.to_string());
+            }
+            "rpcpassword" if !value.is_empty() => {
+                config.rpc_password = Some(value.to_string());
+            }
+            "maxconnections" => {
+                if let Ok(n) = value.parse::<usize>() {
+                    config.max_connections = if n == 0 { usize::MAX } else { n };
                 }
-                _ => {} // forward-compatible: ignore unknown keys
             }
+            "wsendpoint" if !value.is_empty() => {
+                config.ws_endpoint = Some(value.to_string());
+            }
+            "editor" if !value.is_empty() => {
+                config.editor = Some(value.to_string());
+            }
+            _ => {} // forward-compatible: ignore unknown keys
         }
     }
 
@@ -441,6 +436,9 @@ impl Config {
     ///
     /// Does not write a `testnet=` key — network is stored in `time.toml`.
     pub fn to_time_conf(&self) -> String {
+        use std::fmt::Write as _;
+
+        // Format straight into `out`; writing to a String cannot fail.
         let mut out = String::new();
 
         out.push_str("# TIME Coin Wallet Configuration\n");
@@ -452,7 +450,7 @@ impl Config {
             out.push_str("#addnode=64.91.241.10:24001\n");
         } else {
             for peer in &self.peers {
-                out.push_str(&format!("addnode={}\n", peer));
+                let _ = writeln!(out, "addnode={}", peer);
             }
         }
         out.push('\n');
@@ -460,8 +458,8 @@ impl Config {
         out.push_str("# RPC credentials (from the masternode's time.conf)\n");
         match (&self.rpc_user, &self.rpc_password) {
             (Some(u), Some(p)) => {
-                out.push_str(&format!("rpcuser={}\n", u));
-                out.push_str(&format!("rpcpassword={}\n", p));
+                let _ = writeln!(out, "rpcuser={}", u);
+                let _ = writeln!(out, "rpcpassword={}", p);
             }
             _ => {
                 out.push_str("#rpcuser=timecoinrpc\n");
@@ -476,14 +474,14 @@ impl Config {
         } else {
             self.max_connections
         };
-        out.push_str(&format!("maxconnections={}\n\n", mc));
+        let _ = writeln!(out, "maxconnections={}\n", mc);
 
         if let Some(ref ws) = self.ws_endpoint {
-            out.push_str(&format!("wsendpoint={}\n\n", ws));
+            let _ = writeln!(out, "wsendpoint={}\n", ws);
         }
 
         if let Some(ref ed) = self.editor {
-            out.push_str(&format!("editor={}\n\n", ed));
+            let _ = writeln!(out, "editor={}\n", ed);
         }
 
         out
@@ -532,16 +530,22 @@ impl Config {
     /// The masternode WS server listens on RPC port + 1, so we bump the port
     /// and swap the scheme: `http://host:24101` → `wss://host:24102`.
     pub fn derive_ws_url(endpoint: &str) -> String {
-        let base = endpoint
-            .replacen("https://", "wss://", 1)
-            .replacen("http://", "wss://", 1);
+        // Match the scheme once and build the result in a single allocation,
+        // rather than running two full-string `replacen` passes.
+        let (scheme, rest) = match endpoint
+            .strip_prefix("https://")
+            .or_else(|| endpoint.strip_prefix("http://"))
+        {
+            Some(rest) => ("wss://", rest),
+            None => ("", endpoint),
+        };
         // Bump port: WS port = RPC port + 1
-        if let Some(colon) = base.rfind(':') {
-            if let Ok(rpc_port) = base[colon + 1..].parse::<u16>() {
-                return format!("{}{}", &base[..colon + 1], rpc_port + 1);
+        if let Some((host, port)) = rest.rsplit_once(':') {
+            if let Ok(rpc_port) = port.parse::<u16>() {
+                return format!("{}{}:{}", scheme, host, rpc_port + 1);
             }
         }
-        base
+        format!("{}{}", scheme, rest)
     }
 
     /// Get the RPC port for the current network.
@@ -660,6 +664,36 @@ pub enum ConfigError {
     InvalidPeer(String),
 }
 
+/// Iterate the `key=value` pairs of a `time.conf` (Bitcoin-style, `#` comments).
+///
+/// Blank lines, comment-only lines and lines without `=` are skipped; keys and
+/// values are returned trimmed.
+fn conf_entries(contents: &str) -> impl Iterator<Item = (&str, &str)> {
+    contents.lines().filter_map(|raw| {
+        let line = raw.find('#').map_or(raw, |p| &raw[..p]).trim();
+        let (key, value) = line.split_once('=')?;
+        Some((key.trim(), value.trim()))
+    })
+}
+
+/// Write `contents` to `path` unless the file already holds exactly that.
+///
+/// Saving settings usually rewrites an unchanged file; skipping the write keeps
+/// its mtime stable for editors and file watchers. Changed contents go to a
+/// sibling temp file that is renamed over `path`, so a crash mid-write never
+/// leaves a truncated config. Returns whether it wrote.
+fn write_if_changed(path: &Path, contents: &str) -> std::io::Result<bool> {
+    if fs::read(path).is_ok_and(|existing| existing == contents.as_bytes()) {
+        return Ok(false);
+    }
+    let mut temp_path = path.as_os_str().to_owned();
+    temp_path.push(".tmp");
+    let temp_path = PathBuf::from(temp_path);
+    fs::write(&temp_path, contents)?;
+    fs::rename(&temp_path, path)?;
+    Ok(true)
+}
+
 /// Auto-detect an installed text editor, returning its path if found.
 fn detect_editor() -> Option<String> {
     #[cfg(target_os = "windows")]
@@ -708,6 +742,22 @@ fn detect_editor() -> Option<String> {
 mod tests {
     use super::*;
 
+    #[test]
+    fn test_write_if_changed_skips_identical_contents() {
+        let dir = std::env::temp_dir().join("time-coin-config-test");
+        fs::create_dir_all(&dir).unwrap();
+        let path = dir.join("write_if_changed.conf");
+        let _ = fs::remove_file(&path);
+
+        assert!(write_if_changed(&path, "maxconnections=8\n").unwrap());
+        assert!(!write_if_changed(&path, "maxconnections=8\n").unwrap());
+        assert!(write_if_changed(&path, "maxconnections=16\n").unwrap());
+        assert_eq!(fs::read_to_string(&path).unwrap(), "maxconnections=16\n");
+        assert!(!dir.join("write_if_changed.conf.tmp").exists());
+
+        let _ = fs::remove_file(&path);
+    }
+
     #[test]
     fn test_default_config() {
         let config = Config::default();
@@ -789,12 +839,19 @@ addnode=1.2.3.4:24101
 rpcuser=alice
 rpcpassword=secret
 ";
-        let c = Config::parse_time_conf_legacy(conf);
+        let c = Config::parse_time_conf_legacy(conf).expect("conf has a testnet= key");
         assert_eq!(c.network, "testnet");
         assert_eq!(c.peers, vec!["1.2.3.4:24101"]);
         assert_eq!(c.rpc_user.as_deref(), Some("alice"));
     }
 
+    #[test]
+    fn test_parse_time_conf_legacy_without_testnet_key() {
+        // Current-format files carry no testnet= key and must not be migrated
+        let conf = "addnode=1.2.3.4:24001\n# testnet=1 (commented out)\n";
+        assert!(Config::parse_time_conf_legacy(conf).is_none());
+    }
+
     #[test]
     fn test_parse_time_conf_maxconnections_zero() {
         let c = Config::parse_time_conf("maxconnections=0\n");
@@ -825,6 +882,15 @@ rpcpassword=secret
         assert_eq!(config2.ws_url(), "wss://127.0.0.1:24102");
     }
 
+    #[test]
+    fn test_derive_ws_url_without_scheme_or_port() {
+        assert_eq!(Config::derive_ws_url("10.0.0.1:24001"), "10.0.0.1:24002");
+        assert_eq!(
+            Config::derive_ws_url("https://example.com"),
+            "wss://example.com"
+        );
+    }
+
     #[test]
     fn test_ws_url_explicit() {
         let config = Config {
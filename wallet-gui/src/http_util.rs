@@ -0,0 +1,25 @@
+//! Small HTTP helpers shared by the masternode RPC client and peer discovery.
+
+/// Read a response body, giving up once it grows past `limit` bytes.
+///
+/// Returns `Ok(None)` when the body (or its advertised `Content-Length`)
+/// exceeds the limit; the rest of the body is never downloaded.
+pub async fn read_body_capped(
+    mut response: reqwest::Response,
+    limit: usize,
+) -> Result<Option<Vec<u8>>, reqwest::Error> {
+    if response
+        .content_length()
+        .is_some_and(|len| len > limit as u64)
+    {
+        return Ok(None);
+    }
+    let mut body = Vec::new();
+    while let Some(chunk) = response.chunk().await? {
+        if body.len() + chunk.len() > limit {
+            return Ok(None);
+        }
+        body.extend_from_slice(&chunk);
+    }
+    Ok(Some(body))
+}
@@ -9,6 +9,7 @@ mod config_new;
 mod encryption;
 #[allow(dead_code)]
 mod events;
+mod http_util;
 #[allow(dead_code)]
 mod masternode_client;
 mod memo;
@@ -67,7 +68,7 @@ fn main() -> Result<(), eframe::Error> {
     };
 
     let result = eframe::run_native(
-        &format!("TIME Coin Wallet v{}", env!("CARGO_PKG_VERSION")),
+        concat!("TIME Coin Wallet v", env!("CARGO_PKG_VERSION")),
         options,
         Box::new(move |cc| Ok(Box::new(app::App::new(cc, config)))),
     );
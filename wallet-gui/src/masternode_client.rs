@@ -4,20 +4,63 @@
 //! The masternode exposes an axum-based HTTP server on the RPC port
 //! (24101 for testnet, 24001 for mainnet).
 
+use crate::http_util::read_body_capped;
+use reqwest::header::{HeaderValue, AUTHORIZATION};
 use reqwest::Client;
 use serde::{Deserialize, Serialize};
 use std::sync::atomic::{AtomicU64, Ordering};
+use std::sync::OnceLock;
 use std::time::Duration;
 
 static REQUEST_ID: AtomicU64 = AtomicU64::new(1);
 
+/// Largest JSON-RPC response body accepted from a masternode.
+///
+/// Generous enough for full-history `listtransactionsmulti` chunks, but keeps
+/// a misbehaving peer from streaming an unbounded body into memory.
+const MAX_RPC_RESPONSE_BYTES: usize = 64 * 1024 * 1024;
+
+/// Process-wide HTTP client shared by every [`MasternodeClient`].
+///
+/// Discovery builds a client per peer every few seconds; sharing one
+/// `reqwest::Client` (cloning is a refcount bump) keeps a single connection
+/// pool, so repeat calls to a peer reuse its TCP/TLS connection instead of
+/// handshaking again.
+fn shared_http_client() -> Client {
+    static CLIENT: OnceLock<Client> = OnceLock::new();
+    CLIENT
+        .get_or_init(|| {
+            // Accept self-signed certificates — masternodes use auto-generated certs (TOFU model).
+            // Timeout is set to 5 minutes to accommodate slow chain-scan RPCs
+            // (listtransactionsmulti on a large chain can take 60–90 s per chunk).
+            Client::builder()
+                .timeout(Duration::from_secs(300))
+                .connect_timeout(Duration::from_secs(10))
+                .danger_accept_invalid_certs(true)
+                .build()
+                .expect("Failed to create HTTP client")
+        })
+        .clone()
+}
+
+/// Encode an HTTP Basic `Authorization` header value, marked sensitive so it
+/// is redacted from debug output.
+fn basic_auth_header(user: &str, pass: &str) -> Option<HeaderValue> {
+    use base64::{engine::general_purpose, Engine as _};
+
+    let encoded = general_purpose::STANDARD.encode(format!("{}:{}", user, pass));
+    let mut value = HeaderValue::try_from(format!("Basic {}", encoded)).ok()?;
+    value.set_sensitive(true);
+    Some(value)
+}
+
 /// Parse a JSON numeric value to satoshis (1 TIME = 100_000_000 satoshis).
 /// Handles plain decimal strings ("12.34567890") and scientific notation
 /// ("1e-8", "1.5e2") that serde_json may emit for very small/large floats.
 pub fn json_to_satoshis(val: &serde_json::Value) -> u64 {
-    let s = match val {
-        serde_json::Value::Number(n) => n.to_string(),
-        serde_json::Value::String(s) => s.clone(),
+    let s: std::borrow::Cow<'_, str> = match val {
+        serde_json::Value::Number(n) => n.to_string().into(),
+        serde_json::Value::String(s) => s.as_str().into(),
         _ => return 0,
     };
 
@@ -35,9 +78,9 @@ pub fn json_to_satoshis(val: &serde_json::Value) -> u64 {
 /// Like `json_to_satoshis` but returns the absolute value (for amounts/fees
 /// that may be negative in the RPC response).
 fn json_to_satoshis_abs(val: &serde_json::Value) -> u64 {
-    let s = match val {
-        serde_json::Value::Number(n) => n.to_string(),
-        serde_json::Value::String(s) => s.clone(),
+    let s: std::borrow::Cow<'_, str> = match val {
+        serde_json::Value::Number(n) => n.to_string().into(),
+        serde_json::Value::String(s) => s.as_str().into(),
         _ => return 0,
     };
 
@@ -47,16 +90,26 @@ fn json_to_satoshis_abs(val: &serde_json::Value) -> u64 {
 /// Convert a non-negative decimal or scientific-notation string to satoshis.
 /// Falls back to f64 parsing when the string contains 'e'/'E'.
 fn parse_time_string_to_satoshis(s: &str) -> u64 {
-    // Fast path: plain decimal (no scientific notation)
-    if !s.contains('e') && !s.contains('E') {
+    // Fast path: plain decimal (no scientific notation). One scan for
+    // either exponent marker instead of one full scan per case.
+    if !s.contains(['e', 'E']) {
         let (whole, frac) = if let Some(dot) = s.find('.') {
             (&s[..dot], &s[dot + 1..])
         } else {
             (s, "")
         };
         let whole_val: u64 = whole.parse().unwrap_or(0);
-        let frac_padded = format!("{:0<8}", &frac[..frac.len().min(8)]);
-        let frac_val: u64 = frac_padded[..8].parse().unwrap_or(0);
+        // Accumulate up to 8 fraction digits and scale by the missing places,
+        // rather than right-padding into a temporary String and re-parsing.
+        let digits = &frac.as_bytes()[..frac.len().min(8)];
+        let frac_val = if digits.iter().all(u8::is_ascii_digit) {
+            let value = digits
+                .iter()
+                .fold(0u64, |acc, d| acc * 10 + u64::from(d - b'0'));
+            value * 10u64.pow(8 - digits.len() as u32)
+        } else {
+            0
+        };
         return whole_val
             .saturating_mul(100_000_000)
             .saturating_add(frac_val);
@@ -73,16 +126,17 @@ fn parse_time_string_to_satoshis(s: &str) -> u64 {
 pub struct MasternodeClient {
     rpc_endpoint: String,
     client: Client,
-    /// Optional HTTP Basic Auth credentials (user, password)
-    rpc_credentials: Option<(String, String)>,
+    /// Pre-encoded HTTP Basic `Authorization` header, built once from the
+    /// optional (user, password) credentials.
+    auth_header: Option<HeaderValue>,
 }
 
 /// JSON-RPC 2.0 request
 #[derive(Debug, Serialize)]
-struct JsonRpcRequest {
+struct JsonRpcRequest<'a> {
     jsonrpc: &'static str,
     id: String,
-    method: String,
+    method: &'a str,
     params: serde_json::Value,
 }
 
@@ -113,15 +167,7 @@ impl MasternodeClient {
             format!("http://{}", endpoint)
         };
 
-        // Accept self-signed certificates — masternodes use auto-generated certs (TOFU model).
-        // Timeout is set to 5 minutes to accommodate slow chain-scan RPCs
-        // (listtransactionsmulti on a large chain can take 60–90 s per chunk).
-        let client = Client::builder()
-            .timeout(Duration::from_secs(300))
-            .connect_timeout(Duration::from_secs(10))
-            .danger_accept_invalid_certs(true)
-            .build()
-            .expect("Failed to create HTTP client");
+        let client = shared_http_client();
 
         if credentials.is_some() {
             log::info!(
@@ -138,7 +184,7 @@ impl MasternodeClient {
         Self {
             rpc_endpoint,
             client,
-            rpc_credentials: credentials,
+            auth_header: credentials.and_then(|(user, pass)| basic_auth_header(&user, &pass)),
         }
     }
 
@@ -156,7 +202,7 @@ impl MasternodeClient {
         let request = JsonRpcRequest {
             jsonrpc: "2.0",
             id: id.to_string(),
-            method: method.to_string(),
+            method,
             params,
         };
 
@@ -164,8 +210,8 @@ impl MasternodeClient {
 
         let mut req = self.client.post(&self.rpc_endpoint).json(&request);
 
-        if let Some((ref user, ref pass)) = self.rpc_credentials {
-            req = req.basic_auth(user, Some(pass));
+        if let Some(ref auth) = self.auth_header {
+            req = req.header(AUTHORIZATION, auth.clone());
         }
 
         let response = req.send().await?;
@@ -174,10 +220,23 @@ impl MasternodeClient {
             return Err(ClientError::http(response.status().as_u16()));
         }
 
-        let bytes = response.bytes().await.map_err(|e| {
-            log::error!("Failed to read response body for '{}': {:#?}", method, e);
-            ClientError::InvalidResponse(format!("Failed to read response body: {}", e))
-        })?;
+        let bytes = read_body_capped(response, MAX_RPC_RESPONSE_BYTES)
+            .await
+            .map_err(|e| {
+                log::error!("Failed to read response body for '{}': {:#?}", method, e);
+                ClientError::InvalidResponse(format!("Failed to read response body: {}", e))
+            })?
+            .ok_or_else(|| {
+                log::error!(
+                    "Response for '{}' exceeds {} bytes",
+                    method,
+                    MAX_RPC_RESPONSE_BYTES
+                );
+                ClientError::InvalidResponse(format!(
+                    "Response body exceeds {} bytes",
+                    MAX_RPC_RESPONSE_BYTES
+                ))
+            })?;
 
         let rpc_response: JsonRpcResponse = serde_json::from_slice(&bytes).map_err(|e| {
             let preview = String::from_utf8_lossy(&bytes[..bytes.len().min(512)]);
@@ -508,10 +567,71 @@ impl MasternodeClient {
             .rpc_call("listunspentmulti", serde_json::json!([[address]]))
             .await?;
 
+        let utxos = Self::parse_utxos(result);
+        Self::log_utxo_summary(&utxos);
+        Ok(utxos)
+    }
+
+    /// Get UTXOs for many addresses with one `listunspentmulti` call per
+    /// chunk, instead of one round trip per address.
+    ///
+    /// Best effort: a failed chunk is logged and skipped so the remaining
+    /// chunks still contribute; the error is only returned when nothing came
+    /// back. Use [`Self::get_utxos_multi_strict`] when a partial list must
+    /// not be mistaken for the full set.
+    pub async fn get_utxos_multi(&self, addresses: &[String]) -> Result<Vec<Utxo>, ClientError> {
+        match self.fetch_utxo_chunks(addresses).await {
+            (utxos, Some(e)) if utxos.is_empty() => Err(e),
+            (utxos, _) => Ok(utxos),
+        }
+    }
+
+    /// Like [`Self::get_utxos_multi`], but fails if any chunk failed.
+    pub async fn get_utxos_multi_strict(
+        &self,
+        addresses: &[String],
+    ) -> Result<Vec<Utxo>, ClientError> {
+        match self.fetch_utxo_chunks(addresses).await {
+            (_, Some(e)) => Err(e),
+            (utxos, None) => Ok(utxos),
+        }
+    }
+
+    /// Run `listunspentmulti` over `addresses` in chunks, returning every
+    /// UTXO that came back together with the first chunk error, if any.
+    async fn fetch_utxo_chunks(&self, addresses: &[String]) -> (Vec<Utxo>, Option<ClientError>) {
+        const CHUNK_SIZE: usize = 25;
+
+        let mut all = Vec::new();
+        let mut first_error = None;
+        for chunk in addresses.chunks(CHUNK_SIZE) {
+            match self
+                .rpc_call("listunspentmulti", serde_json::json!([chunk]))
+                .await
+            {
+                Ok(result) => all.extend(Self::parse_utxos(result)),
+                Err(e) => {
+                    log::warn!(
+                        "listunspentmulti chunk ({} addrs) failed: {}",
+                        chunk.len(),
+                        e
+                    );
+                    first_error.get_or_insert(e);
+                }
+            }
+        }
+        if !addresses.is_empty() {
+            Self::log_utxo_summary(&all);
+        }
+        (all, first_error)
+    }
+
+    /// Parse a `listunspentmulti` result array into [`Utxo`]s.
+    fn parse_utxos(result: serde_json::Value) -> Vec<Utxo> {
         let utxo_values: Vec<serde_json::Value> =
             serde_json::from_value(result).unwrap_or_default();
 
-        let utxos: Vec<Utxo> = utxo_values
+        utxo_values
             .into_iter()
             .filter_map(|u| {
                 let txid = u.get("txid")?.as_str()?.to_string();
@@ -535,8 +655,10 @@ impl MasternodeClient {
                     spendable,
                 })
             })
-            .collect();
+            .collect()
+    }
 
+    fn log_utxo_summary(utxos: &[Utxo]) {
         let spendable_count = utxos.iter().filter(|u| u.spendable).count();
         log::info!(
             "✅ Retrieved {} UTXOs ({} spendable, {} locked)",
@@ -544,7 +666,6 @@ impl MasternodeClient {
             spendable_count,
             utxos.len() - spendable_count
         );
-        Ok(utxos)
     }
 
     /// Fetch UTXOs for a batch of addresses in a single `listunspentmulti` call.
@@ -770,9 +891,13 @@ impl MasternodeClient {
 
     /// Check if masternode is reachable via getblockchaininfo
     pub async fn health_check(&self) -> Result<HealthStatus, ClientError> {
-        let result = self
-            .rpc_call("getblockchaininfo", serde_json::json!([]))
-            .await?;
+        // Both calls are independent; issue them together so a health check
+        // costs one round trip instead of two.
+        let (chain_info, network_info) = tokio::join!(
+            self.rpc_call("getblockchaininfo", serde_json::json!([])),
+            self.rpc_call("getnetworkinfo", serde_json::json!([])),
+        );
+        let result = chain_info?;
 
         // Masternode returns "blocks", fall back to "height" for compat
         let height = result
@@ -788,21 +913,20 @@ impl MasternodeClient {
             .unwrap_or("unknown")
             .to_string();
 
-        // Fetch connection count and daemon version from getnetworkinfo
-        let (peer_count, version) =
-            if let Ok(ni) = self.rpc_call("getnetworkinfo", serde_json::json!([])).await {
-                let peers = ni.get("connections").and_then(|v| v.as_u64()).unwrap_or(0) as u32;
-                // subversion is "/timed:0.1.0/" — strip the slashes
-                let ver = ni
-                    .get("subversion")
-                    .and_then(|v| v.as_str())
-                    .unwrap_or("")
-                    .trim_matches('/')
-                    .to_string();
-                (peers, ver)
-            } else {
-                (0, String::new())
-            };
+        // Connection count and daemon version from getnetworkinfo
+        let (peer_count, version) = if let Ok(ni) = network_info {
+            let peers = ni.get("connections").and_then(|v| v.as_u64()).unwrap_or(0) as u32;
+            // subversion is "/timed:0.1.0/" — strip the slashes
+            let ver = ni
+                .get("subversion")
+                .and_then(|v| v.as_str())
+                .unwrap_or("")
+                .trim_matches('/')
+                .to_string();
+            (peers, ver)
+        } else {
+            (0, String::new())
+        };
 
         let is_syncing = result
             .get("initialblockdownload")
@@ -1176,6 +1300,26 @@ mod tests {
         assert_eq!(client.endpoint(), "http://127.0.0.1:24101");
     }
 
+    #[test]
+    fn test_parse_time_string_to_satoshis() {
+        assert_eq!(parse_time_string_to_satoshis("12.34567890"), 1_234_567_890);
+        assert_eq!(parse_time_string_to_satoshis("5"), 500_000_000);
+        assert_eq!(parse_time_string_to_satoshis("0.5"), 50_000_000);
+        assert_eq!(parse_time_string_to_satoshis("1e-8"), 1);
+        assert_eq!(parse_time_string_to_satoshis("1.5E2"), 15_000_000_000);
+        assert_eq!(parse_time_string_to_satoshis("0.123456789"), 12_345_678);
+        assert_eq!(parse_time_string_to_satoshis("3."), 300_000_000);
+        assert_eq!(parse_time_string_to_satoshis("1.2x"), 100_000_000);
+    }
+
+    #[test]
+    fn test_basic_auth_header() {
+        // RFC 7617 example credentials
+        let header = basic_auth_header("Aladdin", "open sesame").unwrap();
+        assert_eq!(header, "Basic QWxhZGRpbjpvcGVuIHNlc2FtZQ==");
+        assert!(header.is_sensitive());
+    }
+
     #[test]
     fn test_balance_serialization() {
         let balance = Balance {
@@ -5,13 +5,19 @@
 //! 2. API peers from `https://time-coin.io/api/peers`
 //! 3. Cached peers from `~/.time-wallet/peers.dat` (fallback when API is down)
 //!
-//! After a successful API fetch, the peer list is cached to `peers.dat`
-//! so the wallet can still connect if the website goes down.
+//! After each discovery round, the healthy peers (or the API list when none
+//! answered) are cached to `peers.dat` so the wallet can still connect if the
+//! website goes down.
 
+use crate::http_util::read_body_capped;
 use reqwest::Client;
 use serde::{Deserialize, Serialize};
+use std::collections::hash_map::DefaultHasher;
 use std::fs;
-use std::path::PathBuf;
+use std::hash::{Hash, Hasher};
+use std::path::{Path, PathBuf};
+use std::sync::atomic::{AtomicU64, Ordering};
+use std::sync::OnceLock;
 use std::time::Duration;
 
 /// Mainnet peer list URL.
@@ -26,6 +32,9 @@ const MAINNET_PORT: u16 = 24001;
 /// Testnet RPC port.
 const TESTNET_PORT: u16 = 24101;
 
+/// Upper bound on the peer-list API response; a list of IPs is a few KB.
+const MAX_PEERS_RESPONSE_BYTES: usize = 256 * 1024;
+
 /// Cached peer list stored in `peers.dat`.
 #[derive(Debug, Serialize, Deserialize)]
 struct PeerCache {
@@ -35,15 +44,13 @@ struct PeerCache {
 
 /// Fetch peers from the API, falling back to the local cache.
 ///
-/// On success the peer list is saved to `~/.time-wallet/peers.dat` for
-/// future offline use.  Returns `http://{ip}:{port}` endpoint URLs.
+/// The list is not cached here; [`save_discovered_peers`] writes
+/// `~/.time-wallet/peers.dat` once the round's peers have been probed.
+/// Returns `https://{ip}:{port}` endpoint URLs.
 pub async fn fetch_peers(is_testnet: bool) -> Result<Vec<String>, PeerDiscoveryError> {
     // Try API first
     match fetch_from_api(is_testnet).await {
-        Ok(endpoints) => {
-            save_cache(is_testnet, &endpoints);
-            Ok(endpoints)
-        }
+        Ok(endpoints) => Ok(endpoints),
         Err(api_err) => {
             log::warn!("⚠ API peer discovery failed: {}", api_err);
             // Fall back to cached peers
@@ -58,6 +65,23 @@ pub async fn fetch_peers(is_testnet: bool) -> Result<Vec<String>, PeerDiscoveryE
     }
 }
 
+/// HTTP client for the website API, shared across discovery rounds.
+///
+/// Discovery re-fetches the peer list periodically; keeping one client keeps
+/// its connection pool, so later rounds reuse the open connection instead of
+/// paying for another DNS lookup and TLS handshake.
+fn api_client() -> Result<Client, reqwest::Error> {
+    static CLIENT: OnceLock<Client> = OnceLock::new();
+    if let Some(client) = CLIENT.get() {
+        return Ok(client.clone());
+    }
+    let client = Client::builder()
+        .timeout(Duration::from_secs(10))
+        .connect_timeout(Duration::from_secs(5))
+        .build()?;
+    Ok(CLIENT.get_or_init(|| client).clone())
+}
+
 /// Fetch the peer list directly from the website API.
 async fn fetch_from_api(is_testnet: bool) -> Result<Vec<String>, PeerDiscoveryError> {
     let url = if is_testnet {
@@ -74,10 +98,7 @@ async fn fetch_from_api(is_testnet: bool) -> Result<Vec<String>, PeerDiscoveryEr
 
     log::info!("🔍 Fetching peers from {}", url);
 
-    let client = Client::builder()
-        .timeout(Duration::from_secs(10))
-        .connect_timeout(Duration::from_secs(5))
-        .build()?;
+    let client = api_client()?;
 
     let response = client.get(url).send().await?;
 
@@ -85,7 +106,12 @@ async fn fetch_from_api(is_testnet: bool) -> Result<Vec<String>, PeerDiscoveryEr
         return Err(PeerDiscoveryError::HttpStatus(response.status().as_u16()));
     }
 
-    let ips: Vec<String> = response.json().await?;
+    let body = read_body_capped(response, MAX_PEERS_RESPONSE_BYTES)
+        .await?
+        .ok_or(PeerDiscoveryError::ResponseTooLarge(
+            MAX_PEERS_RESPONSE_BYTES,
+        ))?;
+    let ips: Vec<String> = serde_json::from_slice(&body)?;
 
     if ips.is_empty() {
         return Err(PeerDiscoveryError::NoPeers);
@@ -109,33 +135,113 @@ fn cache_path() -> Option<PathBuf> {
     Some(home.join(".time-wallet").join("peers.dat"))
 }
 
-fn save_cache(is_testnet: bool, endpoints: &[String]) {
-    let Some(path) = cache_path() else { return };
+/// Fingerprint of the peer list last written to `peers.dat` (0 = none yet).
+///
+/// [`save_discovered_peers`] is the only writer, so this always describes
+/// the file's current contents; rounds that find the same peers skip the
+/// disk write.
+static LAST_SAVED_FINGERPRINT: AtomicU64 = AtomicU64::new(0);
+
+/// Order-independent fingerprint of a network's peer list.
+///
+/// Healthy peers are re-sorted by ping on every round, so the endpoint
+/// hashes are summed rather than chained to ignore ordering.
+fn cache_fingerprint(is_testnet: bool, endpoints: &[String]) -> u64 {
+    fn hash_one<T: Hash + ?Sized>(value: &T) -> u64 {
+        let mut hasher = DefaultHasher::new();
+        value.hash(&mut hasher);
+        hasher.finish()
+    }
+    endpoints
+        .iter()
+        .fold(hash_one(&(is_testnet, endpoints.len())), |acc, ep| {
+            acc.wrapping_add(hash_one(ep.as_str()))
+        })
+}
+
+/// Pick the list a discovery round should cache and write it to `path`.
+///
+/// The probed healthy list is preferred; the raw API list is only kept when
+/// no peer answered, so the next start still has endpoints to try. Returns
+/// whether the file was written.
+fn save_round(
+    path: &Path,
+    last_saved: &AtomicU64,
+    is_testnet: bool,
+    healthy: &[String],
+    api_peers: &[String],
+) -> bool {
+    let endpoints = if healthy.is_empty() {
+        api_peers
+    } else {
+        healthy
+    };
+    if endpoints.is_empty() {
+        return false;
+    }
+    write_cache(path, last_saved, is_testnet, endpoints)
+}
+
+/// Write `endpoints` to `path` unless `last_saved` shows the same list is
+/// already on disk. Returns whether the file was written.
+fn write_cache(
+    path: &Path,
+    last_saved: &AtomicU64,
+    is_testnet: bool,
+    endpoints: &[String],
+) -> bool {
+    let fingerprint = cache_fingerprint(is_testnet, endpoints);
+    if last_saved.load(Ordering::Relaxed) == fingerprint {
+        return false;
+    }
     let cache = PeerCache {
         network: if is_testnet { "testnet" } else { "mainnet" }.to_string(),
         peers: endpoints.to_vec(),
     };
-    match serde_json::to_string(&cache) {
+    match serde_json::to_vec(&cache) {
         Ok(json) => {
-            if let Err(e) = fs::write(&path, json) {
+            // Write to a temp file and rename so readers never see a partial cache
+            let temp_path = path.with_extension("dat.tmp");
+            let written = fs::write(&temp_path, json).and_then(|()| fs::rename(&temp_path, path));
+            if let Err(e) = written {
                 log::warn!("⚠ Failed to write peers.dat: {}", e);
+                false
             } else {
+                last_saved.store(fingerprint, Ordering::Relaxed);
                 log::info!("💾 Cached {} peers to {}", endpoints.len(), path.display());
+                true
             }
         }
-        Err(e) => log::warn!("⚠ Failed to serialize peer cache: {}", e),
+        Err(e) => {
+            log::warn!("⚠ Failed to serialize peer cache: {}", e);
+            false
+        }
     }
 }
 
-/// Save discovered peers to the cache (called from service after gossip discovery).
-pub fn save_discovered_peers(is_testnet: bool, endpoints: &[String]) {
-    save_cache(is_testnet, endpoints);
+/// Save a discovery round's peers to the cache (called from service after
+/// gossip discovery).
+///
+/// `healthy` are the peers that passed the health probe and `api_peers` the
+/// list returned by [`fetch_peers`]; see [`save_round`] for which is kept.
+pub fn save_discovered_peers(is_testnet: bool, healthy: &[String], api_peers: &[String]) {
+    if let Some(path) = cache_path() {
+        save_round(
+            &path,
+            &LAST_SAVED_FINGERPRINT,
+            is_testnet,
+            healthy,
+            api_peers,
+        );
+    }
 }
 
 fn load_cache(is_testnet: bool) -> Option<Vec<String>> {
     let path = cache_path()?;
-    let contents = fs::read_to_string(&path).ok()?;
-    let cache: PeerCache = serde_json::from_str(&contents).ok()?;
+    // Parse straight from the raw bytes; serde_json validates the UTF-8 of
+    // string values itself, so a separate `read_to_string` pass is redundant.
+    let contents = fs::read(&path).ok()?;
+    let cache: PeerCache = serde_json::from_slice(&contents).ok()?;
     let expected_network = if is_testnet { "testnet" } else { "mainnet" };
     if cache.network != expected_network {
         log::warn!(
@@ -165,6 +271,12 @@ pub enum PeerDiscoveryError {
 
     #[error("No peers returned by API")]
     NoPeers,
+
+    #[error("Peer API response exceeds {0} bytes")]
+    ResponseTooLarge(usize),
+
+    #[error("Invalid peer API response: {0}")]
+    Json(#[from] serde_json::Error),
 }
 
 #[cfg(test)]
@@ -206,4 +318,87 @@ mod tests {
         // Simulates load_cache rejecting wrong network
         assert_ne!(loaded.network, "mainnet");
     }
+
+    #[test]
+    fn test_cache_fingerprint_ignores_order() {
+        let a = vec![
+            "https://1.2.3.4:24001".to_string(),
+            "https://5.6.7.8:24001".to_string(),
+        ];
+        let b = vec![a[1].clone(), a[0].clone()];
+        assert_eq!(cache_fingerprint(false, &a), cache_fingerprint(false, &b));
+        assert_ne!(cache_fingerprint(false, &a), cache_fingerprint(true, &a));
+        assert_ne!(
+            cache_fingerprint(false, &a),
+            cache_fingerprint(false, &a[..1])
+        );
+    }
+
+    #[test]
+    fn test_save_round_keeps_healthy_list_on_disk() {
+        let dir = std::env::temp_dir().join("time-coin-peers-test");
+        fs::create_dir_all(&dir).unwrap();
+        let path = dir.join("peers.dat");
+        let _ = fs::remove_file(&path);
+        let read_peers = || {
+            let cache: PeerCache = serde_json::from_slice(&fs::read(&path).unwrap()).unwrap();
+            cache.peers
+        };
+
+        let last_saved = AtomicU64::new(0);
+        let api_list = vec!["https://1.2.3.4:24001".to_string()];
+        let api_list2 = vec![
+            "https://1.2.3.4:24001".to_string(),
+            "https://9.9.9.9:24001".to_string(),
+        ];
+        let healthy_list = vec![
+            "https://1.2.3.4:24001".to_string(),
+            "http://5.6.7.8:24001".to_string(),
+        ];
+        let healthy_reordered = vec![healthy_list[1].clone(), healthy_list[0].clone()];
+
+        // Round 1 caches the healthy list, not the raw API list
+        assert!(save_round(
+            &path,
+            &last_saved,
+            false,
+            &healthy_list,
+            &api_list
+        ));
+        assert_eq!(read_peers(), healthy_list);
+
+        // Round 2: the API list changed but the healthy list did not
+        assert!(!save_round(
+            &path,
+            &last_saved,
+            false,
+            &healthy_list,
+            &api_list2
+        ));
+        assert!(!save_round(
+            &path,
+            &last_saved,
+            false,
+            &healthy_reordered,
+            &api_list2
+        ));
+        assert_eq!(read_peers(), healthy_list);
+
+        // No peer answered: fall back to the API list, then recover
+        assert!(save_round(&path, &last_saved, false, &[], &api_list2));
+        assert_eq!(read_peers(), api_list2);
+        assert!(save_round(
+            &path,
+            &last_saved,
+            false,
+            &healthy_list,
+            &api_list2
+        ));
+        assert_eq!(read_peers(), healthy_list);
+
+        assert!(!save_round(&path, &last_saved, false, &[], &[]));
+        assert!(!dir.join("peers.dat.tmp").exists());
+
+        let _ = fs::remove_file(&path);
+    }
 }
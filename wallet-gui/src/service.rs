@@ -14,7 +14,9 @@ use std::time::Instant;
 
 use crate::config_new::Config;
 use crate::events::{PaymentRequest, Screen, ServiceEvent, UiEvent};
-use crate::masternode_client::{MasternodeClient, TransactionRecord, TransactionStatus};
+use crate::masternode_client::{
+    ClientError, MasternodeClient, TransactionRecord, TransactionStatus,
+};
 use crate::peer_discovery;
 use crate::state::{AddressInfo, PeerInfo};
 use crate::wallet_dat;
@@ -93,9 +95,13 @@ pub async fn run(
         pending_address_scan: false,
     };
 
+    // Resolved once: without explicit credentials this reads the masternode's
+    // .cookie file, and both the restored client and discovery need the result.
+    let mut rpc_credentials = config.rpc_credentials();
+
     // Restore manually-selected peer so discovery doesn't override it on first result.
     if let Some(ref ep) = config.preferred_endpoint.clone() {
-        state.client = Some(MasternodeClient::new(ep.clone(), config.rpc_credentials()));
+        state.client = Some(MasternodeClient::new(ep.clone(), rpc_credentials.clone()));
         state.config.active_endpoint = Some(ep.clone());
         log::info!("📌 Restoring preferred peer from config: {}", ep);
     }
@@ -112,7 +118,6 @@ pub async fn run(
     // Kick off peer discovery in the background (skip on first run — wait for network selection)
     let mut is_testnet = config.is_testnet();
     let mut manual_endpoints = config.manual_endpoints();
-    let mut rpc_credentials = config.rpc_credentials();
     let mut discovery_handle: Option<DiscoveryHandle> = if config.is_first_run {
         None
     } else {
@@ -221,13 +226,7 @@ pub async fn run(
                                 bal_client.get_balances(&bal_addrs),
                                 tx_client.get_transactions_multi(&tx_addrs, 0, from_height),
                                 async {
-                                    let mut all = Vec::new();
-                                    for addr in &utxo_addrs {
-                                        if let Ok(utxos) = utxo_client.get_utxos(addr).await {
-                                            all.extend(utxos);
-                                        }
-                                    }
-                                    all
+                                    utxo_client.get_utxos_multi(&utxo_addrs).await.unwrap_or_default()
                                 },
                             );
 
@@ -509,17 +508,13 @@ pub async fn run(
 
                     UiEvent::RefreshUtxos => {
                         if let Some(ref client) = state.client {
-                            let mut all_utxos = Vec::new();
-                            for addr in &state.addresses {
-                                match client.get_utxos(addr).await {
-                                    Ok(utxos) => all_utxos.extend(utxos),
-                                    Err(e) => {
-                                        let _ = state.svc_tx.send(ServiceEvent::Error(e.to_string()));
-                                        break;
-                                    }
+                            // Strict fetch: a partial list would silently replace the full set.
+                            match client.get_utxos_multi_strict(&state.addresses).await {
+                                Ok(utxos) => state.send_utxos_updated(utxos),
+                                Err(e) => {
+                                    let _ = state.svc_tx.send(ServiceEvent::Error(e.to_string()));
                                 }
                             }
-                            state.send_utxos_updated(all_utxos);
                         }
                     }
 
@@ -542,17 +537,13 @@ pub async fn run(
 
                                 for attempt in 0..max_retries {
                                     // Fetch UTXOs from masternode and sync into wallet
-                                    all_utxos.clear();
-                                    for addr in &addrs_to_query {
-                                        match client.get_utxos(addr).await {
-                                            Ok(utxos) => {
-                                                all_utxos.extend(utxos);
-                                            }
-                                            Err(e) => {
-                                                log::warn!("Failed to fetch UTXOs for {}: {}", addr, e);
-                                            }
+                                    all_utxos = match client.get_utxos_multi(&addrs_to_query).await {
+                                        Ok(utxos) => utxos,
+                                        Err(e) => {
+                                            log::warn!("Failed to fetch UTXOs: {}", e);
+                                            Vec::new()
                                         }
-                                    }
+                                    };
                                     log::debug!("UTXO sync (attempt {}): {} UTXOs fetched", attempt + 1, all_utxos.len());
                                     let wallet_inner = wm.get_active_wallet_mut();
                                     while !wallet_inner.utxos().is_empty() {
@@ -766,12 +757,7 @@ pub async fn run(
                                                                 let _ = state.svc_tx.send(ServiceEvent::BalanceUpdated(balance));
                                                             }
                                                             // Refresh UTXOs so per-address balances reflect the spend immediately.
-                                                            let mut refreshed_utxos = Vec::new();
-                                                            for addr in &state.addresses {
-                                                                if let Ok(utxos) = client.get_utxos(addr).await {
-                                                                    refreshed_utxos.extend(utxos);
-                                                                }
-                                                            }
+                                                            let refreshed_utxos = client.get_utxos_multi(&state.addresses).await.unwrap_or_default();
                                                             if !refreshed_utxos.is_empty() {
                                                                 let _ = state.svc_tx.send(ServiceEvent::UtxosUpdated(refreshed_utxos));
                                                             }
@@ -826,12 +812,7 @@ pub async fn run(
                                         }
                                     }
                                     Screen::Utxos => {
-                                        let mut all = Vec::new();
-                                        for addr in &state.addresses {
-                                            if let Ok(utxos) = client.get_utxos(addr).await {
-                                                all.extend(utxos);
-                                            }
-                                        }
+                                        let all = client.get_utxos_multi(&state.addresses).await.unwrap_or_default();
                                         state.send_utxos_updated(all);
                                     }
                                     _ => {}
@@ -1485,12 +1466,7 @@ pub async fn run(
                                     }
                                     Err(e) => log::warn!("Resync balance fetch failed: {}", e),
                                 }
-                                let mut all_utxos = Vec::new();
-                                for addr in &state.addresses {
-                                    if let Ok(utxos) = client.get_utxos(addr).await {
-                                        all_utxos.extend(utxos);
-                                    }
-                                }
+                                let all_utxos = client.get_utxos_multi(&state.addresses).await.unwrap_or_default();
                                 state.send_utxos_updated(all_utxos);
                             }
                         }
@@ -1596,12 +1572,7 @@ pub async fn run(
                                     }
                                     Err(e) => log::warn!("Repair: failed to fetch balance: {}", e),
                                 }
-                                let mut all_utxos = Vec::new();
-                                for addr in &state.addresses {
-                                    if let Ok(utxos) = client.get_utxos(addr).await {
-                                        all_utxos.extend(utxos);
-                                    }
-                                }
+                                let all_utxos = client.get_utxos_multi(&state.addresses).await.unwrap_or_default();
                                 state.send_utxos_updated(all_utxos);
                             }
                         }
@@ -2093,14 +2064,12 @@ pub async fn run(
                         if let Some(ref db) = state.wallet_db {
                             match std::fs::read_to_string(&path) {
                                 Ok(contents) => {
-                                    let mut count = 0;
-                                    for line in contents.lines() {
-                                        if let Some(entry) = crate::wallet_db::MasternodeEntry::parse_conf_line(line) {
-                                            let _ = db.save_masternode_entry(&entry);
-                                            count += 1;
-                                        }
-                                    }
-                                    log::info!("Imported {} masternode entries from {}", count, path.display());
+                                    let imported: Vec<_> = contents
+                                        .lines()
+                                        .filter_map(crate::wallet_db::MasternodeEntry::parse_conf_line)
+                                        .collect();
+                                    let _ = db.save_masternode_entries(&imported);
+                                    log::info!("Imported {} masternode entries from {}", imported.len(), path.display());
                                     if let Ok(entries) = db.get_masternode_entries() {
                                         let _ = state.svc_tx.send(ServiceEvent::MasternodeEntriesLoaded(entries));
                                     }
@@ -2175,14 +2144,7 @@ pub async fn run(
                                             // without waiting for the next poll cycle.
                                             let refresh_addresses = state.addresses.clone();
                                             if !refresh_addresses.is_empty() {
-                                                let mut fresh_utxos = Vec::new();
-                                                for addr in &refresh_addresses {
-                                                    if let Ok(utxos) =
-                                                        client.get_utxos(addr).await
-                                                    {
-                                                        fresh_utxos.extend(utxos);
-                                                    }
-                                                }
+                                                let fresh_utxos = client.get_utxos_multi(&refresh_addresses).await.unwrap_or_default();
                                                 state.send_utxos_updated(fresh_utxos);
                                                 if let Ok(bal) =
                                                     client.get_balances(&refresh_addresses).await
@@ -2250,14 +2212,7 @@ pub async fn run(
                                             // collateral shows as spendable again right away.
                                             let refresh_addresses = state.addresses.clone();
                                             if !refresh_addresses.is_empty() {
-                                                let mut fresh_utxos = Vec::new();
-                                                for addr in &refresh_addresses {
-                                                    if let Ok(utxos) =
-                                                        client.get_utxos(addr).await
-                                                    {
-                                                        fresh_utxos.extend(utxos);
-                                                    }
-                                                }
+                                                let fresh_utxos = client.get_utxos_multi(&refresh_addresses).await.unwrap_or_default();
                                                 state.send_utxos_updated(fresh_utxos);
                                                 if let Ok(bal) =
                                                     client.get_balances(&refresh_addresses).await
@@ -2472,12 +2427,7 @@ pub async fn run(
                                         decrypt_memos(&mut txs, &state.signing_keys);
                                         let _ = state.svc_tx.send(ServiceEvent::TransactionsUpdated(txs));
                                     }
-                                    let mut all_utxos = Vec::new();
-                                    for addr in &state.addresses {
-                                        if let Ok(utxos) = client.get_utxos(addr).await {
-                                            all_utxos.extend(utxos);
-                                        }
-                                    }
+                                    let all_utxos = client.get_utxos_multi(&state.addresses).await.unwrap_or_default();
                                     let utxo_sum: u64 = all_utxos.iter().map(|u| u.amount).sum();
                                     log::info!("🔍 Post-finalization UTXOs: count={} total={}", all_utxos.len(), utxo_sum);
                                     state.send_utxos_updated(all_utxos);
@@ -2784,11 +2734,147 @@ fn ws_dedup(seen: &mut std::collections::HashMap<String, std::time::Instant>, ke
     let now = std::time::Instant::now();
     // Purge stale entries (older than 60s) to prevent unbounded growth
     seen.retain(|_, t| now.duration_since(*t).as_secs() < 60);
-    if seen.contains_key(&key) {
-        return true; // duplicate
+    match seen.entry(key) {
+        std::collections::hash_map::Entry::Occupied(_) => true, // duplicate
+        std::collections::hash_map::Entry::Vacant(slot) => {
+            slot.insert(now);
+            false
+        }
+    }
+}
+
+/// Strip a leading `https://` or `http://` from an endpoint, leaving `host:port`.
+///
+/// One prefix match replaces the `replacen` / `trim_start_matches` chains that
+/// each rescanned the endpoint once per scheme.
+fn strip_scheme(endpoint: &str) -> &str {
+    endpoint
+        .strip_prefix("https://")
+        .or_else(|| endpoint.strip_prefix("http://"))
+        .unwrap_or(endpoint)
+}
+
+/// Health-check one peer: TCP ping, JSON-RPC over HTTPS with a plain-HTTP
+/// fallback, then WebSocket reachability and tier for healthy peers.
+///
+/// Shared by the initial probe and gossip discovery. `label` names the peer
+/// kind in log messages ("Peer", "Gossip peer").
+async fn probe_peer(
+    endpoint: String,
+    creds: Option<(String, String)>,
+    label: &'static str,
+) -> PeerInfo {
+    let probe_timeout = std::time::Duration::from_secs(4);
+
+    // Always probe the https:// form first; plain-http form is the fallback.
+    let host_port = strip_scheme(&endpoint);
+    let https_ep = format!("https://{}", host_port);
+    let http_ep = format!("http://{}", host_port);
+
+    // TCP connect for accurate network ping (strips scheme)
+    let tcp_addr = host_port.trim_end_matches('/');
+    let tcp_start = Instant::now();
+    let tcp_ok = tokio::time::timeout(
+        std::time::Duration::from_secs(1),
+        tokio::net::TcpStream::connect(tcp_addr),
+    )
+    .await
+    .map(|r| r.is_ok())
+    .unwrap_or(false);
+    let ping_ms = if tcp_ok {
+        Some(tcp_start.elapsed().as_millis() as u64)
+    } else {
+        None
+    };
+
+    let (is_healthy, is_syncing, block_height, version, working_ep) = if tcp_ok {
+        // Try HTTPS first
+        let client = MasternodeClient::new(https_ep.clone(), creds.clone());
+        match tokio::time::timeout(probe_timeout, client.health_check()).await {
+            Ok(Ok(health)) => (
+                true,
+                health.is_syncing,
+                Some(health.block_height),
+                Some(health.version),
+                https_ep,
+            ),
+            Ok(Err(e @ (ClientError::Http(..) | ClientError::RpcError(..)))) => {
+                // The peer answered over TLS, so a plain-HTTP retry would only
+                // cost another connection to get the same answer.
+                log::warn!("⚠ {} {} unhealthy: {}", label, https_ep, e);
+                (false, false, None, None, endpoint.clone())
+            }
+            _ => {
+                // HTTPS failed — retry with plain HTTP (masternode auto-detects)
+                log::debug!("HTTPS failed for {}, retrying with HTTP", https_ep);
+                let http_client = MasternodeClient::new(http_ep.clone(), creds.clone());
+                match tokio::time::timeout(probe_timeout, http_client.health_check()).await {
+                    Ok(Ok(health)) => {
+                        log::info!("✅ {} {} reachable via HTTP (no TLS)", label, http_ep);
+                        (
+                            true,
+                            health.is_syncing,
+                            Some(health.block_height),
+                            Some(health.version),
+                            http_ep,
+                        )
+                    }
+                    Ok(Err(e)) => {
+                        log::warn!("⚠ {} {} unhealthy: {}", label, http_ep, e);
+                        (false, false, None, None, endpoint.clone())
+                    }
+                    Err(_) => {
+                        log::warn!("⚠ {} {} timed out", label, http_ep);
+                        (false, false, None, None, endpoint.clone())
+                    }
+                }
+            }
+        }
+    } else {
+        (false, false, None, None, endpoint.clone())
+    };
+
+    // Probe WebSocket connectivity (WS port = RPC port + 1)
+    let ws_available = if is_healthy {
+        let ws_url = crate::config_new::Config::derive_ws_url(&working_ep);
+        tokio::time::timeout(
+            std::time::Duration::from_secs(3),
+            tokio_tungstenite::connect_async_tls_with_config(
+                &ws_url,
+                None,
+                false,
+                Some(crate::ws_client::make_tls_connector()),
+            ),
+        )
+        .await
+        .map(|r| r.is_ok())
+        .unwrap_or(false)
+    } else {
+        false
+    };
+
+    // Best-effort tier query — non-blocking, ignored on failure
+    let tier = if is_healthy {
+        let tier_client = MasternodeClient::new(working_ep.clone(), creds);
+        tokio::time::timeout(std::time::Duration::from_secs(5), tier_client.get_tier())
+            .await
+            .ok()
+            .flatten()
+    } else {
+        None
+    };
+
+    PeerInfo {
+        endpoint: working_ep,
+        is_active: false,
+        is_healthy,
+        is_syncing,
+        ws_available,
+        ping_ms,
+        block_height,
+        version,
+        tier,
     }
-    seen.insert(key, now);
-    false
 }
 
 /// Discover and health-check peers in the background.
@@ -2802,10 +2888,12 @@ async fn discover_peers(
 ) -> Result<(String, Vec<PeerInfo>), ()> {
     let rpc_port = if is_testnet { 24101 } else { 24001 };
     let mut endpoints = manual_endpoints;
+    let mut api_peers = Vec::new();
     match peer_discovery::fetch_peers(is_testnet).await {
-        Ok(api_peers) => {
-            log::info!("🌐 API returned {} peers", api_peers.len());
-            endpoints.extend(api_peers);
+        Ok(peers) => {
+            log::info!("🌐 API returned {} peers", peers.len());
+            endpoints.extend_from_slice(&peers);
+            api_peers = peers;
         }
         Err(e) => {
             log::warn!("⚠ Peer discovery failed: {}", e);
@@ -2824,123 +2912,16 @@ async fn discover_peers(
     }
 
     // Probe all peers in parallel with a short timeout
-    let probe_timeout = std::time::Duration::from_secs(4);
-    let mut handles = Vec::new();
-    for endpoint in endpoints.clone() {
-        let creds = rpc_credentials.clone();
-        handles.push(tokio::spawn(async move {
-            // Always probe the https:// form first; plain-http form is the fallback.
-            let https_ep = if endpoint.starts_with("http://") {
-                endpoint.replacen("http://", "https://", 1)
-            } else {
-                endpoint.clone()
-            };
-            let http_ep = https_ep.replacen("https://", "http://", 1);
-
-            // TCP connect for accurate network ping (strips scheme)
-            let tcp_addr = https_ep
-                .strip_prefix("https://")
-                .unwrap_or(&https_ep)
-                .trim_end_matches('/');
-            let tcp_start = Instant::now();
-            let tcp_ok = tokio::time::timeout(
-                std::time::Duration::from_secs(1),
-                tokio::net::TcpStream::connect(tcp_addr),
-            )
-            .await
-            .map(|r| r.is_ok())
-            .unwrap_or(false);
-            let ping_ms = if tcp_ok {
-                Some(tcp_start.elapsed().as_millis() as u64)
-            } else {
-                None
-            };
-
-            let (is_healthy, is_syncing, block_height, version, working_ep) = if tcp_ok {
-                // Try HTTPS first
-                let client = MasternodeClient::new(https_ep.clone(), creds.clone());
-                match tokio::time::timeout(probe_timeout, client.health_check()).await {
-                    Ok(Ok(health)) => (
-                        true,
-                        health.is_syncing,
-                        Some(health.block_height),
-                        Some(health.version),
-                        https_ep.clone(),
-                    ),
-                    _ => {
-                        // HTTPS failed — retry with plain HTTP (masternode auto-detects)
-                        log::debug!("HTTPS failed for {}, retrying with HTTP", https_ep);
-                        let http_client = MasternodeClient::new(http_ep.clone(), creds.clone());
-                        match tokio::time::timeout(probe_timeout, http_client.health_check()).await
-                        {
-                            Ok(Ok(health)) => {
-                                log::info!("✅ Peer {} reachable via HTTP (no TLS)", http_ep);
-                                (
-                                    true,
-                                    health.is_syncing,
-                                    Some(health.block_height),
-                                    Some(health.version),
-                                    http_ep.clone(),
-                                )
-                            }
-                            Ok(Err(e)) => {
-                                log::warn!("⚠ Peer {} unhealthy: {}", http_ep, e);
-                                (false, false, None, None, endpoint.clone())
-                            }
-                            Err(_) => {
-                                log::warn!("⚠ Peer {} timed out", http_ep);
-                                (false, false, None, None, endpoint.clone())
-                            }
-                        }
-                    }
-                }
-            } else {
-                (false, false, None, None, endpoint.clone())
-            };
-
-            // Probe WebSocket connectivity (WS port = RPC port + 1)
-            let ws_available = if is_healthy {
-                let ws_url = crate::config_new::Config::derive_ws_url(&working_ep);
-                tokio::time::timeout(
-                    std::time::Duration::from_secs(3),
-                    tokio_tungstenite::connect_async_tls_with_config(
-                        &ws_url,
-                        None,
-                        false,
-                        Some(crate::ws_client::make_tls_connector()),
-                    ),
-                )
-                .await
-                .map(|r| r.is_ok())
-                .unwrap_or(false)
-            } else {
-                false
-            };
-
-            // Best-effort tier query — non-blocking, ignored on failure
-            let tier = if is_healthy {
-                let tier_client = MasternodeClient::new(working_ep.clone(), creds.clone());
-                tokio::time::timeout(std::time::Duration::from_secs(5), tier_client.get_tier())
-                    .await
-                    .ok()
-                    .flatten()
-            } else {
-                None
-            };
-
-            PeerInfo {
-                endpoint: working_ep,
-                is_active: false,
-                is_healthy,
-                is_syncing,
-                ws_available,
-                ping_ms,
-                block_height,
-                version,
-                tier,
-            }
-        }));
-    }
+    let handles: Vec<_> = endpoints
+        .iter()
+        .map(|endpoint| {
+            tokio::spawn(probe_peer(
+                endpoint.clone(),
+                rpc_credentials.clone(),
+                "Peer",
+            ))
+        })
+        .collect();
 
     let mut peer_infos = Vec::new();
     for handle in handles {
@@ -2960,14 +2941,7 @@ async fn discover_peers(
             let b_https = b.endpoint.starts_with("https://") as u8;
             b_https.cmp(&a_https)
         });
-        peer_infos.retain(|p| {
-            let normalized = p
-                .endpoint
-                .trim_start_matches("https://")
-                .trim_start_matches("http://")
-                .to_string();
-            seen.insert(normalized)
-        });
+        peer_infos.retain(|p| seen.insert(strip_scheme(&p.endpoint).to_string()));
     }
 
     // Sort: fully-synced first, then WS-capable, then healthy by fastest ping, syncing/unhealthy last
@@ -3030,9 +3004,7 @@ async fn discover_peers(
     let known_hosts: std::collections::HashSet<String> = peer_infos
         .iter()
         .filter_map(|p| {
-            p.endpoint
-                .trim_start_matches("https://")
-                .trim_start_matches("http://")
+            strip_scheme(&p.endpoint)
                 .trim_end_matches('/')
                 .split(':')
                 .next()
@@ -3046,23 +3018,29 @@ async fn discover_peers(
         .map(|p| p.endpoint.clone())
         .collect();
 
-    // Query all healthy peers for their neighbour lists in parallel.
-    let gossip_handles: Vec<_> = gossip_endpoints
-        .iter()
-        .map(|ep| {
-            let client = MasternodeClient::new(ep.clone(), rpc_credentials.clone());
-            tokio::spawn(async move { client.get_peer_info().await })
-        })
-        .collect();
+    // Query all healthy peers for their neighbour lists in parallel, and start
+    // probing each newly-seen peer as soon as the first list naming it arrives
+    // rather than waiting for the slowest neighbour list.
+    let mut gossip_queries = tokio::task::JoinSet::new();
+    for ep in &gossip_endpoints {
+        let client = MasternodeClient::new(ep.clone(), rpc_credentials.clone());
+        gossip_queries.spawn(async move { client.get_peer_info().await });
+    }
     let mut new_endpoints: std::collections::HashSet<String> = std::collections::HashSet::new();
-    for handle in gossip_handles {
-        if let Ok(Ok(gossip_peers)) = handle.await {
-            for gp in &gossip_peers {
-                let ip = gp.addr.split(':').next().unwrap_or(&gp.addr);
-                let host_key = format!("{}:{}", ip, rpc_port);
-                if !known_hosts.contains(&host_key) {
-                    new_endpoints.insert(format!("https://{}:{}", ip, rpc_port));
-                }
+    let mut gossip_probes = tokio::task::JoinSet::new();
+    while let Some(result) = gossip_queries.join_next().await {
+        let Ok(Ok(gossip_peers)) = result else {
+            continue;
+        };
+        for gp in &gossip_peers {
+            let ip = gp.addr.split(':').next().unwrap_or(&gp.addr);
+            let host_key = format!("{}:{}", ip, rpc_port);
+            if known_hosts.contains(&host_key) {
+                continue;
+            }
+            let ep = format!("https://{}", host_key);
+            if new_endpoints.insert(ep.clone()) {
+                gossip_probes.spawn(probe_peer(ep, rpc_credentials.clone(), "Gossip peer"));
             }
         }
     }
@@ -3072,109 +3050,9 @@ async fn discover_peers(
             "🔗 Gossip discovery: found {} new peers",
             new_endpoints.len()
         );
-        // Probe new peers in parallel
-        let probe_timeout2 = std::time::Duration::from_secs(4);
-        let mut gossip_handles = Vec::new();
-        for ep in new_endpoints {
-            let creds = rpc_credentials.clone();
-            gossip_handles.push(tokio::spawn(async move {
-                // Gossip peers are built as https://; fall back to http:// like the initial probe.
-                let http_ep = ep.replacen("https://", "http://", 1);
-
-                // TCP connect for accurate network ping
-                let tcp_addr = ep
-                    .strip_prefix("https://")
-                    .unwrap_or(&ep)
-                    .trim_end_matches('/');
-                let tcp_start = Instant::now();
-                let tcp_ok = tokio::time::timeout(
-                    std::time::Duration::from_secs(1),
-                    tokio::net::TcpStream::connect(tcp_addr),
-                )
-                .await
-                .map(|r| r.is_ok())
-                .unwrap_or(false);
-                let ping_ms = if tcp_ok {
-                    Some(tcp_start.elapsed().as_millis() as u64)
-                } else {
-                    None
-                };
-
-                let (is_healthy, is_syncing, block_height, version, working_ep) = if tcp_ok {
-                    let c = MasternodeClient::new(ep.clone(), creds.clone());
-                    match tokio::time::timeout(probe_timeout2, c.health_check()).await {
-                        Ok(Ok(health)) => (
-                            true,
-                            health.is_syncing,
-                            Some(health.block_height),
-                            Some(health.version),
-                            ep.clone(),
-                        ),
-                        _ => {
-                            log::debug!("HTTPS failed for gossip peer {}, retrying with HTTP", ep);
-                            let hc = MasternodeClient::new(http_ep.clone(), creds.clone());
-                            match tokio::time::timeout(probe_timeout2, hc.health_check()).await {
-                                Ok(Ok(health)) => {
-                                    log::info!(
-                                        "✅ Gossip peer {} reachable via HTTP (no TLS)",
-                                        http_ep
-                                    );
-                                    (
-                                        true,
-                                        health.is_syncing,
-                                        Some(health.block_height),
-                                        Some(health.version),
-                                        http_ep.clone(),
-                                    )
-                                }
-                                _ => (false, false, None, None, ep.clone()),
-                            }
-                        }
-                    }
-                } else {
-                    (false, false, None, None, ep.clone())
-                };
-                let ws_available = if is_healthy {
-                    let ws_url = crate::config_new::Config::derive_ws_url(&working_ep);
-                    tokio::time::timeout(
-                        std::time::Duration::from_secs(3),
-                        tokio_tungstenite::connect_async_tls_with_config(
-                            &ws_url,
-                            None,
-                            false,
-                            Some(crate::ws_client::make_tls_connector()),
-                        ),
-                    )
-                    .await
-                    .map(|r| r.is_ok())
-                    .unwrap_or(false)
-                } else {
-                    false
-                };
-                let tier = if is_healthy {
-                    let tier_client = MasternodeClient::new(working_ep.clone(), creds.clone());
-                    tokio::time::timeout(std::time::Duration::from_secs(5), tier_client.get_tier())
-                        .await
-                        .ok()
-                        .flatten()
-                } else {
-                    None
-                };
-                PeerInfo {
-                    endpoint: working_ep,
-                    is_active: false,
-                    is_healthy,
-                    is_syncing,
-                    ws_available,
-                    ping_ms,
-                    block_height,
-                    version,
-                    tier,
-                }
-            }));
-        }
-        for handle in gossip_handles {
-            if let Ok(info) = handle.await {
+        // Integrate probe results in completion order
+        while let Some(result) = gossip_probes.join_next().await {
+            if let Ok(info) = result {
                 if !info.is_healthy {
                     continue; // Don't bother adding unhealthy gossip peers
                 }
@@ -3228,9 +3106,7 @@ async fn discover_peers(
         .filter(|p| p.is_healthy)
         .map(|p| p.endpoint.clone())
         .collect();
-    if !healthy_endpoints.is_empty() {
-        peer_discovery::save_discovered_peers(is_testnet, &healthy_endpoints);
-    }
+    peer_discovery::save_discovered_peers(is_testnet, &healthy_endpoints, &api_peers);
 
     for p in &mut peer_infos {
         p.is_active = p.is_healthy && p.endpoint == active_endpoint;
@@ -3487,15 +3363,14 @@ impl ServiceState {
                             let mn_conf_path = self.config.wallet_dir().join("masternode.conf");
                             if mn_conf_path.exists() {
                                 if let Ok(contents) = std::fs::read_to_string(&mn_conf_path) {
-                                    let mut count = 0;
-                                    for line in contents.lines() {
-                                        if let Some(entry) =
-                                            crate::wallet_db::MasternodeEntry::parse_conf_line(line)
-                                        {
-                                            let _ = db.save_masternode_entry(&entry);
-                                            count += 1;
-                                        }
-                                    }
+                                    let imported: Vec<_> = contents
+                                        .lines()
+                                        .filter_map(
+                                            crate::wallet_db::MasternodeEntry::parse_conf_line,
+                                        )
+                                        .collect();
+                                    let _ = db.save_masternode_entries(&imported);
+                                    let count = imported.len();
                                     if count > 0 {
                                         log::info!(
                                             "📥 Auto-imported {} entries from {}",
@@ -3657,7 +3532,6 @@ impl ServiceState {
                             u.txid == entry.collateral_txid && u.vout == entry.collateral_vout
                         }) {
                             entry.collateral_amount = Some(u.amount);
-                            let _ = db.save_masternode_entry(entry);
                             backfilled = true;
                             log::info!(
                                 "💾 Backfilled collateral {} for '{}'",
@@ -3668,8 +3542,9 @@ impl ServiceState {
                     }
                 }
 
-                // Send updated entries whenever amounts were backfilled.
+                // Persist and send updated entries whenever amounts were backfilled.
                 if backfilled {
+                    let _ = db.save_masternode_entries(&entries);
                     entries.sort_by(|a, b| a.alias.cmp(&b.alias));
                     let _ = self
                         .svc_tx
@@ -3750,26 +3625,18 @@ async fn build_masternode_reg_tx(
     use sha2::{Digest, Sha256};
     use wallet::Transaction;
 
+    // Fetch the wallet's UTXOs once; both the collateral lookup and the fee
+    // selection below work from this list.
+    let wallet_utxos = client.get_utxos_multi(addresses).await.unwrap_or_default();
+
     // 1. Find the collateral UTXO owner address and derive their HD keypair
-    let mut collateral_owner_addr: Option<String> = None;
-    for addr in addresses {
-        match client.get_utxos(addr).await {
-            Ok(utxos) => {
-                for utxo in &utxos {
-                    if utxo.txid == collateral_txid && utxo.vout == collateral_vout {
-                        collateral_owner_addr = Some(addr.clone());
-                        break;
-                    }
-                }
-            }
-            Err(_) => continue,
-        }
-        if collateral_owner_addr.is_some() {
-            break;
-        }
-    }
-    let collateral_addr =
-        collateral_owner_addr.ok_or("Collateral UTXO not found in wallet".to_string())?;
+    let collateral_addr = wallet_utxos
+        .iter()
+        .find(|u| {
+            u.txid == collateral_txid && u.vout == collateral_vout && addresses.contains(&u.address)
+        })
+        .map(|u| u.address.clone())
+        .ok_or("Collateral UTXO not found in wallet".to_string())?;
 
     // Find HD index for collateral owner
     let addr_to_index: std::collections::HashMap<String, u32> = (0..wm.get_address_count())
@@ -3802,27 +3669,19 @@ async fn build_masternode_reg_tx(
     let signature_hex = hex::encode(&signature_bytes);
     let owner_pubkey_hex = hex::encode(collateral_kp.public_key_bytes());
 
-    // 3. Fetch all UTXOs to find one for the fee
+    // 3. Find a UTXO for the fee, preferring addresses in wallet order
     let min_fee: u64 = 1_000_000; // 0.01 TIME
-    let mut fee_utxo = None;
-    let mut all_utxos = Vec::new();
-    for addr in addresses {
-        match client.get_utxos(addr).await {
-            Ok(utxos) => {
-                for utxo in &utxos {
-                    // Don't use the collateral UTXO for fee payment
-                    let is_collateral =
-                        utxo.txid == collateral_txid && utxo.vout == collateral_vout;
-                    if !is_collateral && utxo.amount >= min_fee && fee_utxo.is_none() {
-                        fee_utxo = Some(utxo.clone());
-                    }
-                    all_utxos.push(utxo.clone());
-                }
-            }
-            Err(_) => continue,
-        }
-    }
-    let fee_utxo = fee_utxo.ok_or("No UTXO available to pay registration fee".to_string())?;
+    let fee_utxo = addresses
+        .iter()
+        .find_map(|addr| {
+            wallet_utxos.iter().find(|u| {
+                // Don't use the collateral UTXO for fee payment
+                let is_collateral = u.txid == collateral_txid && u.vout == collateral_vout;
+                &u.address == addr && !is_collateral && u.amount >= min_fee
+            })
+        })
+        .cloned()
+        .ok_or("No UTXO available to pay registration fee".to_string())?;
 
     // 4. Build the transaction
     let mut tx = Transaction::new();
@@ -3970,20 +3829,16 @@ async fn build_masternode_update_tx(
 
     // Find the first wallet address that has a UTXO for the fee
     let min_fee: u64 = 1_000_000; // 0.01 TIME
-    let mut fee_utxo = None;
-    for addr in addresses {
-        match client.get_utxos(addr).await {
-            Ok(utxos) => {
-                for utxo in utxos {
-                    if utxo.amount >= min_fee && fee_utxo.is_none() {
-                        fee_utxo = Some(utxo);
-                    }
-                }
-            }
-            Err(_) => continue,
-        }
-    }
-    let fee_utxo = fee_utxo.ok_or("No UTXO available to pay update fee".to_string())?;
+    let wallet_utxos = client.get_utxos_multi(addresses).await.unwrap_or_default();
+    let fee_utxo = addresses
+        .iter()
+        .find_map(|addr| {
+            wallet_utxos
+                .iter()
+                .find(|u| &u.address == addr && u.amount >= min_fee)
+        })
+        .cloned()
+        .ok_or("No UTXO available to pay update fee".to_string())?;
 
     // Sign the update payload with address #0 (the owner key)
     let owner_index = 0u32;
@@ -4143,7 +3998,7 @@ async fn mn_backfill_via_gettxout(
     if missing.is_empty() {
         return;
     }
-    let mut updated = false;
+    let mut updated = Vec::new();
     for mut entry in missing {
         match client
             .get_tx_out(&entry.collateral_txid, entry.collateral_vout)
@@ -4151,9 +4006,8 @@ async fn mn_backfill_via_gettxout(
         {
             Ok(Some((sats, _addr))) => {
                 entry.collateral_amount = Some(sats);
-                let _ = db.save_masternode_entry(&entry);
                 log::info!("💾 startup: backfilled {} sats for '{}'", sats, entry.alias);
-                updated = true;
+                updated.push(entry);
             }
             Ok(None) => {
                 log::warn!(
@@ -4168,7 +4022,8 @@ async fn mn_backfill_via_gettxout(
             }
         }
     }
-    if updated {
+    if !updated.is_empty() {
+        let _ = db.save_masternode_entries(&updated);
         if let Ok(mut all) = db.get_masternode_entries() {
             all.sort_by(|a, b| a.alias.cmp(&b.alias));
             let _ = svc_tx.send(ServiceEvent::MasternodeEntriesLoaded(all));
@@ -4190,20 +4045,24 @@ async fn consolidate_utxos_background(
     consolidation_txids: Arc<Mutex<HashSet<String>>>,
     consolidation_active: Arc<AtomicBool>,
 ) {
-    // Fetch spendable UTXOs per address and keep them grouped so that each
-    // batch is sent back to the same address the inputs came from.
+    // Fetch spendable UTXOs and group them per address so that each batch is
+    // sent back to the same address the inputs came from.
     let mut utxos_by_addr: std::collections::BTreeMap<String, Vec<crate::masternode_client::Utxo>> =
         std::collections::BTreeMap::new();
-    for addr in &addresses {
-        if let Ok(mut utxos) = client.get_utxos(addr).await {
-            utxos.retain(|u| u.spendable);
-            // Sort smallest-first so dust is consolidated first.
-            utxos.sort_by_key(|u| u.amount);
-            if utxos.len() > 1 {
-                utxos_by_addr.insert(addr.clone(), utxos);
-            }
+    let wallet_addrs: HashSet<&str> = addresses.iter().map(String::as_str).collect();
+    for utxo in client.get_utxos_multi(&addresses).await.unwrap_or_default() {
+        if utxo.spendable && wallet_addrs.contains(utxo.address.as_str()) {
+            utxos_by_addr
+                .entry(utxo.address.clone())
+                .or_default()
+                .push(utxo);
         }
     }
+    utxos_by_addr.retain(|_, utxos| {
+        // Sort smallest-first so dust is consolidated first.
+        utxos.sort_by_key(|u| u.amount);
+        utxos.len() > 1
+    });
 
     let total_utxos: usize = utxos_by_addr.values().map(|v| v.len()).sum();
     if total_utxos == 0 {
@@ -4443,12 +4302,7 @@ async fn consolidate_utxos_background(
     let _ = svc_tx.send(ServiceEvent::ConsolidationComplete { message: msg });
 
     // Refresh UTXOs and balance after consolidation.
-    let mut refreshed = Vec::new();
-    for addr in &addresses {
-        if let Ok(utxos) = client.get_utxos(addr).await {
-            refreshed.extend(utxos);
-        }
-    }
+    let refreshed = client.get_utxos_multi(&addresses).await.unwrap_or_default();
     let _ = svc_tx.send(ServiceEvent::UtxosUpdated(refreshed));
     if let Ok(bal) = client.get_balances(&addresses).await {
         let _ = svc_tx.send(ServiceEvent::BalanceUpdated(bal));
@@ -165,6 +165,9 @@ pub struct AppState {
     pub show_add_contact: bool,
     pub contact_search: String,
     pub receive_search: String,
+    /// Encoded QR code PNG for the receive screen, keyed by the address it
+    /// encodes, so the code is only rebuilt when the selection changes.
+    pub receive_qr_png: Option<(String, std::sync::Arc<[u8]>)>,
     pub editing_contact_address: Option<String>,
     pub editing_contact_name: String,
     pub password_required: bool,
@@ -337,6 +340,7 @@ impl Default for AppState {
             show_add_contact: false,
             contact_search: String::new(),
             receive_search: String::new(),
+            receive_qr_png: None,
             editing_contact_address: None,
             editing_contact_name: String::new(),
             password_required: false,
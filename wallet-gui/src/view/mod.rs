@@ -11,6 +11,24 @@ pub(super) fn truncate_middle(s: &str, prefix: usize, suffix: usize) -> String {
     format!("{}…{}", &s[..prefix], &s[s.len() - suffix..])
 }
 
+/// ASCII case-insensitive substring test against an already-lowercased needle.
+///
+/// For search filters over addresses and txids (always ASCII): matches in
+/// place without lowercasing a fresh copy of every row per frame, and a
+/// needle longer than the haystack is rejected before scanning.
+pub(super) fn contains_ignore_ascii_case(haystack: &str, needle_lower: &str) -> bool {
+    let (haystack, needle) = (haystack.as_bytes(), needle_lower.as_bytes());
+    if needle.is_empty() {
+        return true;
+    }
+    if needle.len() > haystack.len() {
+        return false;
+    }
+    haystack
+        .windows(needle.len())
+        .any(|window| window.eq_ignore_ascii_case(needle))
+}
+
 pub mod connections;
 pub mod income_chart;
 pub mod masternodes;
@@ -22,3 +40,17 @@ pub mod settings;
 pub mod tools;
 pub mod transactions;
 pub mod welcome;
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_contains_ignore_ascii_case() {
+        assert!(contains_ignore_ascii_case("TIME1AbCdEf", "abcd"));
+        assert!(contains_ignore_ascii_case("deadBEEF", "beef"));
+        assert!(contains_ignore_ascii_case("abc", ""));
+        assert!(!contains_ignore_ascii_case("abc", "abcd"));
+        assert!(!contains_ignore_ascii_case("TIME1AbCdEf", "xyz"));
+    }
+}
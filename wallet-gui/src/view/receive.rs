@@ -32,10 +32,17 @@ pub fn show(ui: &mut Ui, state: &mut AppState, ui_tx: &mpsc::UnboundedSender<UiE
 
     // Top section: QR code and selected address details
     ui.horizontal(|ui| {
-        let uri = format!("bytes://qr_{}", selected_addr);
-        if let Some(png) = qr_png_bytes(&selected_addr) {
-            let image =
-                egui::Image::from_bytes(uri, png).fit_to_exact_size(egui::vec2(180.0, 180.0));
+        // Encoding the QR PNG is far costlier than drawing it; reuse the cached
+        // bytes until a different address is selected.
+        let cached = matches!(&state.receive_qr_png, Some((addr, _)) if *addr == selected_addr);
+        if !cached {
+            state.receive_qr_png = qr_png_bytes(&selected_addr)
+                .map(|png| (selected_addr.clone(), std::sync::Arc::from(png)));
+        }
+        if let Some((_, png)) = &state.receive_qr_png {
+            let uri = format!("bytes://qr_{}", selected_addr);
+            let image = egui::Image::from_bytes(uri, std::sync::Arc::clone(png))
+                .fit_to_exact_size(egui::vec2(180.0, 180.0));
             ui.add(image);
         }
 
@@ -121,7 +128,7 @@ pub fn show(ui: &mut Ui, state: &mut AppState, ui_tx: &mpsc::UnboundedSender<UiE
                     if !search.is_empty() {
                         let label_match = state.addresses[i].label.to_lowercase().contains(&search);
                         let addr_match =
-                            state.addresses[i].address.to_lowercase().contains(&search);
+                            super::contains_ignore_ascii_case(&state.addresses[i].address, &search);
                         if !label_match && !addr_match {
                             continue;
                         }
@@ -256,35 +263,59 @@ pub fn show(ui: &mut Ui, state: &mut AppState, ui_tx: &mpsc::UnboundedSender<UiE
 
 /// Generate QR code as PNG bytes for the given data string.
 fn qr_png_bytes(data: &str) -> Option<Vec<u8>> {
-    use image::{ImageEncoder, Rgba, RgbaImage};
+    use image::ImageEncoder;
     use qrcode::QrCode;
 
+    const WHITE: [u8; 4] = [255, 255, 255, 255];
+    const BLACK: [u8; 4] = [0, 0, 0, 255];
+
     let code = QrCode::new(data.as_bytes()).ok()?;
     let colors = code.to_colors();
     let w = code.width();
-    let scale = 8u32;
-    let border = 2u32;
-    let size = (w as u32 + border * 2) * scale;
-
-    let mut img = RgbaImage::from_pixel(size, size, Rgba([255, 255, 255, 255]));
-    for y in 0..w {
-        for x in 0..w {
-            if colors[y * w + x] == qrcode::Color::Dark {
-                for dy in 0..scale {
-                    for dx in 0..scale {
-                        let px = (x as u32 + border) * scale + dx;
-                        let py = (y as u32 + border) * scale + dy;
-                        img.put_pixel(px, py, Rgba([0, 0, 0, 255]));
-                    }
-                }
+    let scale = 8usize;
+    let border = 2usize;
+    let size = (w + border * 2) * scale;
+
+    // Build each scaled pixel row once and repeat it `scale` times, instead of
+    // writing every output pixel individually.
+    let blank_row = WHITE.repeat(size);
+    let border_bytes = border * scale * 4;
+    let mut raw = Vec::with_capacity(blank_row.len() * size);
+    for _ in 0..border * scale {
+        raw.extend_from_slice(&blank_row);
+    }
+    let mut row = Vec::with_capacity(blank_row.len());
+    for modules in colors.chunks_exact(w) {
+        row.clear();
+        row.extend_from_slice(&blank_row[..border_bytes]);
+        for module in modules {
+            let px = if *module == qrcode::Color::Dark {
+                BLACK
+            } else {
+                WHITE
+            };
+            for _ in 0..scale {
+                row.extend_from_slice(&px);
             }
         }
+        row.extend_from_slice(&blank_row[..border_bytes]);
+        for _ in 0..scale {
+            raw.extend_from_slice(&row);
+        }
+    }
+    for _ in 0..border * scale {
+        raw.extend_from_slice(&blank_row);
     }
 
     let mut buf = std::io::Cursor::new(Vec::new());
     let encoder = image::codecs::png::PngEncoder::new(&mut buf);
     encoder
-        .write_image(img.as_raw(), size, size, image::ExtendedColorType::Rgba8)
+        .write_image(
+            &raw,
+            size as u32,
+            size as u32,
+            image::ExtendedColorType::Rgba8,
+        )
         .ok()?;
     Some(buf.into_inner())
 }
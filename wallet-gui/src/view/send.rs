@@ -545,7 +545,7 @@ pub fn show(ui: &mut Ui, state: &mut AppState, ui_tx: &mpsc::UnboundedSender<UiE
             .filter(|c| {
                 search.is_empty()
                     || c.name.to_lowercase().contains(&search)
-                    || c.address.to_lowercase().contains(&search)
+                    || super::contains_ignore_ascii_case(&c.address, &search)
             })
             .collect();
 
@@ -474,8 +474,8 @@ fn show_list(ui: &mut Ui, state: &mut AppState, ui_tx: &mpsc::UnboundedSender<Ui
             if search.is_empty() {
                 return true;
             }
-            tx.address.to_lowercase().contains(&search)
-                || tx.txid.to_lowercase().contains(&search)
+            super::contains_ignore_ascii_case(&tx.address, &search)
+                || super::contains_ignore_ascii_case(&tx.txid, &search)
                 || state
                     .format_time(tx.amount)
                     .to_lowercase()
@@ -167,25 +167,27 @@ impl WalletDb {
         Ok(())
     }
 
-    /// Set default address
+    /// Set default address.
+    ///
+    /// Clearing the old default and marking the new one go into one sled
+    /// batch, so the swap is atomic and costs a single flush.
     pub fn set_default_address(&self, address: &str) -> Result<(), WalletDbError> {
-        // First, unset all defaults
-        for contact in self.get_all_contacts()? {
-            if contact.is_default {
-                let mut updated = contact;
-                updated.is_default = false;
-                updated.updated_at = chrono::Utc::now().timestamp();
-                self.save_contact(&updated)?;
-            }
-        }
+        let now = chrono::Utc::now().timestamp();
+        let mut batch = sled::Batch::default();
 
-        // Set the new default
-        if let Some(mut contact) = self.get_contact(address)? {
-            contact.is_default = true;
-            contact.updated_at = chrono::Utc::now().timestamp();
-            self.save_contact(&contact)?;
+        for mut contact in self.get_all_contacts()? {
+            let is_target = contact.address == address;
+            if !is_target && !contact.is_default {
+                continue;
+            }
+            contact.is_default = is_target;
+            contact.updated_at = now;
+            let key = format!("contact:{}", contact.address);
+            batch.insert(key.as_bytes(), serde_json::to_vec(&contact)?);
         }
 
+        self.db.apply_batch(batch)?;
+        self.db.flush()?;
         Ok(())
     }
 
@@ -437,15 +439,30 @@ impl WalletDb {
 
     // ==================== Cached Data (for instant startup) ====================
 
+    /// Insert and flush `value` under `key` unless it is already stored.
+    ///
+    /// The poll loop re-saves its caches every cycle; an unchanged value costs
+    /// one read instead of a write and a flush.
+    fn insert_if_changed(&self, key: &[u8], value: Vec<u8>) -> Result<(), WalletDbError> {
+        if self
+            .db
+            .get(key)?
+            .is_some_and(|stored| &*stored == value.as_slice())
+        {
+            return Ok(());
+        }
+        self.db.insert(key, value)?;
+        self.db.flush()?;
+        Ok(())
+    }
+
     /// Save cached transactions (from RPC/WS) for instant startup
     pub fn save_cached_transactions(
         &self,
         txs: &[crate::masternode_client::TransactionRecord],
     ) -> Result<(), WalletDbError> {
         let value = bincode::serialize(txs)?;
-        self.db.insert(b"cache:transactions", value)?;
-        self.db.flush()?;
-        Ok(())
+        self.insert_if_changed(b"cache:transactions", value)
     }
 
     /// Load cached transactions for instant startup
@@ -464,9 +481,7 @@ impl WalletDb {
         balance: &crate::masternode_client::Balance,
     ) -> Result<(), WalletDbError> {
         let value = bincode::serialize(balance)?;
-        self.db.insert(b"cache:balance", value)?;
-        self.db.flush()?;
-        Ok(())
+        self.insert_if_changed(b"cache:balance", value)
     }
 
     /// Load cached balance for instant startup
@@ -527,6 +542,24 @@ impl WalletDb {
         Ok(())
     }
 
+    /// Save several masternode entries in one sled batch with a single flush.
+    pub fn save_masternode_entries(
+        &self,
+        entries: &[MasternodeEntry],
+    ) -> Result<(), WalletDbError> {
+        if entries.is_empty() {
+            return Ok(());
+        }
+        let mut batch = sled::Batch::default();
+        for entry in entries {
+            let key = format!("masternode:{}", entry.alias);
+            batch.insert(key.as_bytes(), serde_json::to_vec(entry)?);
+        }
+        self.db.apply_batch(batch)?;
+        self.db.flush()?;
+        Ok(())
+    }
+
     /// Get all masternode entries.
     /// Tries JSON first; falls back to bincode for entries written by older versions
     /// and immediately re-saves them as JSON so future reads succeed.
@@ -586,9 +619,7 @@ impl WalletDb {
         }
 
         // Re-save migrated entries as JSON
-        for entry in to_migrate {
-            let _ = self.save_masternode_entry(&entry);
-        }
+        let _ = self.save_masternode_entries(&to_migrate);
 
         entries.sort_by(|a, b| a.alias.cmp(&b.alias));
         Ok(entries)
@@ -634,13 +665,15 @@ impl WalletDb {
             let (key, value) = item?;
             let key_str = String::from_utf8_lossy(&key);
             // key format: "locked_collateral:txid:vout"
-            let parts: Vec<&str> = key_str.splitn(3, ':').collect();
-            if parts.len() == 3 {
-                let txid = parts[1].to_string();
-                let vout = parts[2].parse::<u32>().unwrap_or(0);
-                let alias = String::from_utf8_lossy(&value).to_string();
-                result.push((txid, vout, alias));
-            }
+            let Some((txid, vout)) = key_str
+                .strip_prefix("locked_collateral:")
+                .and_then(|rest| rest.split_once(':'))
+            else {
+                continue;
+            };
+            let vout = vout.parse::<u32>().unwrap_or(0);
+            let alias = String::from_utf8_lossy(&value).to_string();
+            result.push((txid.to_string(), vout, alias));
         }
         Ok(result)
     }
@@ -676,18 +709,28 @@ impl MasternodeEntry {
         if line.is_empty() || line.starts_with('#') {
             return None;
         }
-        let parts: Vec<&str> = line.split_whitespace().collect();
-        let (txid_idx, vout_idx) = match parts.len() {
-            3 => (1, 2), // alias txid vout
-            4 => (2, 3), // alias IP:port txid vout
-            5 => (3, 4), // alias IP:port key txid vout
-            6 => (4, 5), // alias IP:port key cert txid vout
-            _ => return None,
-        };
+        // Tokenize into a fixed array instead of collecting a Vec. Accepted:
+        //   alias txid vout
+        //   alias IP:port txid vout
+        //   alias IP:port key txid vout
+        //   alias IP:port key cert txid vout
+        // so alias is always first and txid/vout always the last two fields.
+        let mut parts = [""; 6];
+        let mut len = 0;
+        for token in line.split_whitespace() {
+            if len == parts.len() {
+                return None;
+            }
+            parts[len] = token;
+            len += 1;
+        }
+        if len < 3 {
+            return None;
+        }
         Some(MasternodeEntry {
             alias: parts[0].to_string(),
-            collateral_txid: parts[txid_idx].to_string(),
-            collateral_vout: parts[vout_idx].parse().ok()?,
+            collateral_txid: parts[len - 2].to_string(),
+            collateral_vout: parts[len - 1].parse().ok()?,
             payout_address: None,
             collateral_amount: None,
             reg_txid: None,
@@ -6,19 +6,26 @@
 
 use futures_util::{SinkExt, StreamExt};
 use serde::{Deserialize, Serialize};
-use std::sync::Arc;
+use serde_json::value::RawValue;
+use std::sync::{Arc, OnceLock};
 use tokio::sync::mpsc;
 use tokio_tungstenite::tungstenite::Message;
 use tokio_tungstenite::Connector;
 
 /// Build a TLS connector that accepts any certificate (including self-signed).
 /// Used for `wss://` connections to masternodes that generate their own certs.
+///
+/// The rustls `ClientConfig` is built once per process and shared; every
+/// connection and peer probe only clones the `Arc`.
 pub fn make_tls_connector() -> Connector {
     use rustls::client::danger::{HandshakeSignatureValid, ServerCertVerified, ServerCertVerifier};
     use rustls::pki_types::{CertificateDer, ServerName, UnixTime};
 
     #[derive(Debug)]
-    struct AcceptAnyCerts;
+    struct AcceptAnyCerts {
+        /// Resolved once from the ring provider instead of on every handshake.
+        schemes: Vec<rustls::SignatureScheme>,
+    }
 
     impl ServerCertVerifier for AcceptAnyCerts {
         fn verify_server_cert(
@@ -48,17 +55,25 @@ pub fn make_tls_connector() -> Connector {
             Ok(HandshakeSignatureValid::assertion())
         }
         fn supported_verify_schemes(&self) -> Vec<rustls::SignatureScheme> {
-            rustls::crypto::ring::default_provider()
-                .signature_verification_algorithms
-                .supported_schemes()
+            self.schemes.clone()
         }
     }
 
-    let config = rustls::ClientConfig::builder()
-        .dangerous()
-        .with_custom_certificate_verifier(Arc::new(AcceptAnyCerts))
-        .with_no_client_auth();
-    Connector::Rustls(Arc::new(config))
+    static TLS_CONFIG: OnceLock<Arc<rustls::ClientConfig>> = OnceLock::new();
+
+    let config = TLS_CONFIG.get_or_init(|| {
+        let verifier = AcceptAnyCerts {
+            schemes: rustls::crypto::ring::default_provider()
+                .signature_verification_algorithms
+                .supported_schemes(),
+        };
+        let config = rustls::ClientConfig::builder()
+            .dangerous()
+            .with_custom_certificate_verifier(Arc::new(verifier))
+            .with_no_client_auth();
+        Arc::new(config)
+    });
+    Connector::Rustls(Arc::clone(config))
 }
 
 /// Notification received from the masternode WebSocket server
@@ -83,15 +98,29 @@ pub struct UtxoFinalizedNotification {
     pub amount: serde_json::Value,
 }
 
-/// Server message envelope
+/// Server message envelope.
+///
+/// `data` is kept as raw JSON text and deserialized straight into the typed
+/// notification once `type` is known, instead of first building a
+/// `serde_json::Value` tree and converting that.
 #[derive(Deserialize, Debug)]
 struct ServerMessage {
     #[serde(rename = "type")]
     msg_type: String,
     #[serde(default)]
-    data: Option<serde_json::Value>,
+    data: Option<Box<RawValue>>,
 }
 
+/// Payload of a `subscribed` / `subscribed_batch` acknowledgement.
+#[derive(Deserialize)]
+struct SubscribedAck {
+    #[serde(default)]
+    addresses: Vec<serde::de::IgnoredAny>,
+}
+
+/// Heartbeat request, pre-serialized: `ClientMessage { method: "ping", params: {} }`.
+const PING_MESSAGE: &str = r#"{"method":"ping","params":{}}"#;
+
 /// Client message to server
 #[derive(Serialize)]
 struct ClientMessage {
@@ -340,12 +369,7 @@ impl WsClient {
 
                 // Send periodic ping to keep connection alive
                 _ = heartbeat.tick() => {
-                    let ping_msg = ClientMessage {
-                        method: "ping".to_string(),
-                        params: serde_json::json!({}),
-                    };
-                    let json = serde_json::to_string(&ping_msg)?;
-                    if ws_sender.send(Message::Text(json)).await.is_err() {
+                    if ws_sender.send(Message::Text(PING_MESSAGE.to_string())).await.is_err() {
                         break;
                     }
                 }
@@ -368,7 +392,7 @@ impl WsClient {
             Ok(msg) => match msg.msg_type.as_str() {
                 "tx_notification" => {
                     if let Some(data) = msg.data {
-                        match serde_json::from_value::<TxNotification>(data) {
+                        match serde_json::from_str::<TxNotification>(data.get()) {
                             Ok(notif) => {
                                 log::info!(
                                     "💰 Transaction received! {} TIME (txid: {}...)",
@@ -385,7 +409,7 @@ impl WsClient {
                 }
                 "utxo_finalized" => {
                     if let Some(data) = msg.data {
-                        match serde_json::from_value::<UtxoFinalizedNotification>(data) {
+                        match serde_json::from_str::<UtxoFinalizedNotification>(data.get()) {
                             Ok(notif) => {
                                 log::info!(
                                     "✅ UTXO finalized! txid: {}... vout: {}",
@@ -403,20 +427,22 @@ impl WsClient {
                 "subscribed" | "subscribed_batch" => {
                     let count = msg
                         .data
-                        .as_ref()
-                        .and_then(|d| d.get("addresses"))
-                        .and_then(|a| a.as_array())
-                        .map(|a| a.len())
+                        .as_deref()
+                        .and_then(|d| serde_json::from_str::<SubscribedAck>(d.get()).ok())
+                        .map(|ack| ack.addresses.len())
                         .unwrap_or(0);
                     if count > 0 {
                         log::info!("✅ Batch subscription confirmed: {} addresses", count);
                     } else {
-                        log::info!("✅ Subscription confirmed: {:?}", msg.data);
+                        log::info!(
+                            "✅ Subscription confirmed: {}",
+                            msg.data.as_deref().map_or("null", RawValue::get)
+                        );
                     }
                 }
                 "tx_rejected" => {
                     if let Some(data) = msg.data {
-                        match serde_json::from_value::<TxRejectedNotification>(data) {
+                        match serde_json::from_str::<TxRejectedNotification>(data.get()) {
                             Ok(notif) => {
                                 log::warn!(
                                     "❌ Transaction rejected! txid: {}... reason: {}",
@@ -433,7 +459,7 @@ impl WsClient {
                 }
                 "payment_request" => {
                     if let Some(data) = msg.data {
-                        match serde_json::from_value::<PaymentRequestNotification>(data) {
+                        match serde_json::from_str::<PaymentRequestNotification>(data.get()) {
                             Ok(notif) => {
                                 log::info!(
                                     "📨 Payment request received from {} for {} TIME",
@@ -450,7 +476,8 @@ impl WsClient {
                 }
                 "payment_request_response" => {
                     if let Some(data) = msg.data {
-                        match serde_json::from_value::<PaymentRequestResponseNotification>(data) {
+                        match serde_json::from_str::<PaymentRequestResponseNotification>(data.get())
+                        {
                             Ok(notif) => {
                                 log::info!(
                                     "📬 Payment request {} {}",
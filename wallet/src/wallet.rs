@@ -4,8 +4,9 @@ use crate::keypair::{Keypair, KeypairError};
 use crate::mnemonic::{mnemonic_to_keypair_bip44, MnemonicError};
 use crate::transaction::{Transaction, TransactionError, TxInput, TxOutput};
 use serde::{Deserialize, Serialize};
-use std::fs;
-use std::path::Path;
+use std::fs::{self, File};
+use std::io::Write;
+use std::path::{Path, PathBuf};
 use thiserror::Error;
 
 #[derive(Debug, Error)]
@@ -599,17 +600,14 @@ impl Wallet {
 
     /// Save wallet to file
     pub fn save_to_file<P: AsRef<Path>>(&self, path: P) -> Result<(), WalletError> {
-        let serialized =
-            serde_json::to_string_pretty(self).map_err(|_| WalletError::SerializationError)?;
-        fs::write(path, serialized)?;
-        Ok(())
+        write_json_pretty(path, self)
     }
 
     /// Load wallet from file
     pub fn load_from_file<P: AsRef<Path>>(path: P) -> Result<Self, WalletError> {
-        let data = fs::read_to_string(path)?;
+        let data = fs::read(path)?;
         let wallet: Self =
-            serde_json::from_str(&data).map_err(|_| WalletError::SerializationError)?;
+            serde_json::from_slice(&data).map_err(|_| WalletError::SerializationError)?;
         Ok(wallet)
     }
 
@@ -644,11 +642,7 @@ impl Wallet {
         let encrypted = WalletEncryption::encrypt(&wallet_json, password)?;
 
         // Save to file
-        let encrypted_json = serde_json::to_string_pretty(&encrypted)
-            .map_err(|_| WalletError::SerializationError)?;
-        fs::write(path, encrypted_json)?;
-
-        Ok(())
+        write_json_pretty(path, &encrypted)
     }
 
     /// Load wallet from encrypted file with password
@@ -674,9 +668,9 @@ impl Wallet {
         password: &SecurePassword,
     ) -> Result<Self, WalletError> {
         // Read encrypted file
-        let encrypted_json = fs::read_to_string(path)?;
+        let encrypted_json = fs::read(path)?;
         let encrypted: EncryptedWallet =
-            serde_json::from_str(&encrypted_json).map_err(|_| WalletError::SerializationError)?;
+            serde_json::from_slice(&encrypted_json).map_err(|_| WalletError::SerializationError)?;
 
         // Decrypt
         let wallet_json = WalletEncryption::decrypt(&encrypted, password)?;
@@ -695,9 +689,9 @@ impl Wallet {
         path: P,
         password: &SecurePassword,
     ) -> Result<bool, WalletError> {
-        let encrypted_json = fs::read_to_string(path)?;
+        let encrypted_json = fs::read(path)?;
         let encrypted: EncryptedWallet =
-            serde_json::from_str(&encrypted_json).map_err(|_| WalletError::SerializationError)?;
+            serde_json::from_slice(&encrypted_json).map_err(|_| WalletError::SerializationError)?;
 
         Ok(WalletEncryption::verify_password(&encrypted, password)?)
     }
@@ -723,20 +717,16 @@ impl Wallet {
         new_password: &SecurePassword,
     ) -> Result<(), WalletError> {
         // Load current encrypted wallet
-        let encrypted_json = fs::read_to_string(&path)?;
+        let encrypted_json = fs::read(&path)?;
         let encrypted: EncryptedWallet =
-            serde_json::from_str(&encrypted_json).map_err(|_| WalletError::SerializationError)?;
+            serde_json::from_slice(&encrypted_json).map_err(|_| WalletError::SerializationError)?;
 
         // Change password
         let re_encrypted =
             WalletEncryption::change_password(&encrypted, old_password, new_password)?;
 
         // Save
-        let new_encrypted_json = serde_json::to_string_pretty(&re_encrypted)
-            .map_err(|_| WalletError::SerializationError)?;
-        fs::write(path, new_encrypted_json)?;
-
-        Ok(())
+        write_json_pretty(path, &re_encrypted)
     }
 
     /// Check if testnet
@@ -792,6 +782,37 @@ impl std::fmt::Debug for Wallet {
     }
 }
 
+/// Serialize `value` as pretty JSON and atomically replace the file at `path`.
+///
+/// The document is fully serialized before anything touches the disk, then
+/// written to a sibling `.tmp` file, synced and renamed over the target, so a
+/// failure or crash never leaves a truncated wallet behind.
+fn write_json_pretty<P: AsRef<Path>, T: Serialize>(path: P, value: &T) -> Result<(), WalletError> {
+    let path = path.as_ref();
+    let json = serde_json::to_vec_pretty(value).map_err(|_| WalletError::SerializationError)?;
+
+    let mut temp_path = path.as_os_str().to_owned();
+    temp_path.push(".tmp");
+    let temp_path = PathBuf::from(temp_path);
+
+    let written = File::create(&temp_path)
+        .and_then(|mut file| {
+            file.write_all(&json)?;
+            file.sync_all()?;
+            // Keep the replaced file's permissions (e.g. owner-only on a key file)
+            if let Ok(meta) = fs::metadata(path) {
+                fs::set_permissions(&temp_path, meta.permissions())?;
+            }
+            Ok(())
+        })
+        .and_then(|()| fs::rename(&temp_path, path));
+    if let Err(e) = written {
+        let _ = fs::remove_file(&temp_path);
+        return Err(e.into());
+    }
+    Ok(())
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -967,6 +988,21 @@ mod tests {
         let _ = fs::remove_file(temp_file);
     }
 
+    #[test]
+    fn test_save_replaces_existing_file() {
+        let temp_file = "/tmp/test_wallet_replace.json";
+        fs::write(temp_file, "stale contents that are longer than nothing").unwrap();
+
+        let wallet = Wallet::new(NetworkType::Testnet).unwrap();
+        wallet.save_to_file(temp_file).unwrap();
+
+        let loaded = Wallet::load_from_file(temp_file).unwrap();
+        assert_eq!(wallet.address_string(), loaded.address_string());
+        assert!(!Path::new("/tmp/test_wallet_replace.json.tmp").exists());
+
+        let _ = fs::remove_file(temp_file);
+    }
+
     #[test]
     fn test_wallet_from_mnemonic() {
         use crate::mnemonic::generate_mnemonic;